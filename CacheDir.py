@@ -0,0 +1,32 @@
+import os
+
+# Onbellek dizinini belirleyen ortam degiskeni
+CACHE_DIR_ENV = "FINANS_CACHE_DIR"
+
+def cache_dir() -> str:
+    """
+    Varsayılan önbellek dosyalarının yazıldığı dizini geri verir ve yoksa oluşturur.
+    Returns the directory the default cache files are written to, creating it if needed.
+
+    FINANS_CACHE_DIR ortam değişkeni verilmişse o dizin, aksi halde $XDG_CACHE_HOME/finans (ya da ~/.cache/finans) kullanılır.
+    ResponseCache, PriceStore, FxStore ve paylaşılan TradingCalendar, yol verilmediğinde dosyalarını bu dizine yazar.
+
+    Returns:
+        str: Path of the cache directory.
+    """
+    directory = os.environ.get(CACHE_DIR_ENV)
+    if not directory:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        directory = os.path.join(base, "finans")
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+def cache_path(name:str) -> str:
+    """
+    Önbellek dizinindeki bir dosyanın yolunu geri verir.
+    Returns the path of a file in the cache directory.
+
+    Args:
+        name (str): File name, e.g. "http_cache.sqlite3".
+    """
+    return os.path.join(cache_dir(), name)
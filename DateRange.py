@@ -0,0 +1,83 @@
+from datetime import date, datetime, timedelta
+
+def split_date_range(start_date, end_date, window_days=365) -> list:
+    """
+    Bir tarih aralığını ardışık, birbiriyle çakışmayan ve en fazla window_days gün uzunluğunda pencerelere böler.
+    Splits a date range into consecutive, non-overlapping windows of at most window_days days.
+
+    Uzun fiyat geçmişleri tek bir büyük istek yerine bu pencereler halinde, eşzamanlı olarak indirilir.
+
+    Args:
+        start_date (str | date | datetime): Start of the range. String format is dd-mm-YYYY.
+        end_date (str | date | datetime): End of the range (inclusive). String format is dd-mm-YYYY.
+        window_days (int, optional): Maximum length of a window in days. Defaults to 365.
+
+    Returns:
+        list: (start, end) date tuples covering [start_date, end_date] in order; empty if start_date > end_date.
+    """
+    if window_days < 1:
+        raise ValueError(f"Pencere uzunlugu en az 1 gun olmalidir: {window_days}")
+    start, end = to_date(start_date), to_date(end_date)
+    windows = []
+    while start <= end:
+        window_end = min(start + timedelta(days=window_days - 1), end)
+        windows.append((start, window_end))
+        start = window_end + timedelta(days=1)
+    return windows
+
+def to_date(value) -> date:
+    """
+    dd-mm-YYYY biçimindeki metni, datetime veya date nesnesini date nesnesine çevirir.
+    Converts a dd-mm-YYYY string, datetime or date object to a date object.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%d-%m-%Y").date()
+
+def missing_ranges(covered, start_date, end_date) -> list:
+    """
+    İstenen aralıkta, tek parça tutulan bir kapsamın dışında kalan baş ve son tarih aralıklarını geri verir.
+    Returns the head/tail ranges of [start_date, end_date] that lie outside a single contiguous coverage.
+
+    Kapsam tek parça tutulur; istenen aralık kapsamdan kopuksa aradaki boşluk da eksik aralığa dahil edilir.
+
+    Args:
+        covered (tuple | None): (start, end) dates already stored, or None.
+        start_date (str | date | datetime): Start of the requested range. String format is dd-mm-YYYY.
+        end_date (str | date | datetime): End of the requested range (inclusive). String format is dd-mm-YYYY.
+
+    Returns:
+        list: (start, end) date tuples to be downloaded, in order.
+    """
+    start, end = to_date(start_date), to_date(end_date)
+    if covered is None:
+        return [(start, end)]
+    ranges = []
+    if start < covered[0]:
+        ranges.append((start, covered[0] - timedelta(days=1)))
+    if end > covered[1]:
+        ranges.append((covered[1] + timedelta(days=1), end))
+    return ranges
+
+def extend_coverage(covered, start_date, end_date):
+    """
+    İndirilen aralığı kapsama ekler. Bugün ve sonrası gün içinde değişebileceği için kapsama eklenmez.
+    Extends a coverage with a downloaded range. Today and later days are never covered, as they may still change.
+
+    Args:
+        covered (tuple | None): (start, end) dates already stored, or None.
+        start_date (str | date | datetime): Start of the downloaded range. String format is dd-mm-YYYY.
+        end_date (str | date | datetime): End of the downloaded range (inclusive). String format is dd-mm-YYYY.
+
+    Returns:
+        tuple | None: The new (start, end) coverage; the old one if nothing before today was downloaded.
+    """
+    start = to_date(start_date)
+    end = min(to_date(end_date), date.today() - timedelta(days=1))
+    if start > end:
+        return covered
+    if covered is None:
+        return start, end
+    return min(start, covered[0]), max(end, covered[1])
@@ -0,0 +1,147 @@
+import threading
+import pandas as pd
+from datetime import date, timedelta
+from Yahoo import YahooFinancePriceDataFetcher
+from DateRange import to_date, missing_ranges, extend_coverage
+from SqliteConnection import connect
+from CacheDir import cache_path
+
+class FxStore(object):
+    """
+    Döviz kurları için süreç genelinde paylaşılan, bellekte tutulan ve diske yazılan bir kur deposu.
+    A process-wide FX rate store that is memoized in memory and persisted to disk (SQLite).
+
+    Her parite (ör. USDTRY=X) için tek ve kesintisiz bir seri tutulur. İstenen herhangi bir alt aralık bu seriden
+    kesilerek verilir; seri yalnızca istenen aralık mevcut kapsamın dışına taştığında baştan veya sondan genişletilir.
+    Bugüne ait kur gün içinde değişebileceği için kapsama dahil edilmez ve her seferinde yeniden istenir.
+
+    Attributes:
+        path (str): Path of the SQLite database file; doviz_kurlari.sqlite3 in the cache directory (see CacheDir) by default.
+        fetcher (YahooFinancePriceDataFetcher): Fetcher used to extend the series at its edges.
+
+    Methods:
+        shared():
+            Returns the process-wide store, creating it on first use.
+        coverage(pair):
+            Returns the (start, end) dates held for the pair, or None.
+        get(pair, period_1, period_2):
+            Returns the rates of the pair in [period_1, period_2], downloading only the missing edges.
+    """
+
+    # DataFrame sutunlari ve veritabani sutunlari
+    COLUMNS = {
+        "ACILIS": "acilis",
+        "LOW": "dusuk",
+        "HIGH": "yuksek",
+        "KAPANIS-yahoo": "kapanis",
+        "ADJ.KAPANIS-yahoo": "duzeltilmis_kapanis",
+    }
+
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path=None, fetcher=None) -> None:
+        self.path = path if path is not None else cache_path("doviz_kurlari.sqlite3")
+        self.fetcher = fetcher if fetcher is not None else YahooFinancePriceDataFetcher()
+        self.__lock = threading.Lock()
+        # Parite -> (seri, kapsam); diskten bir kez okunur, sonrasinda bellekten kesilir.
+        self.__series = {}
+        value_columns = ", ".join(f"{col} REAL" for col in self.COLUMNS.values())
+        with connect(self.path) as conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS kurlar (parite TEXT NOT NULL, tarih TEXT NOT NULL, {value_columns}, PRIMARY KEY (parite, tarih))")
+            conn.execute("CREATE TABLE IF NOT EXISTS kur_kapsam (parite TEXT PRIMARY KEY, baslangic TEXT NOT NULL, bitis TEXT NOT NULL)")
+
+    @classmethod
+    def shared(cls):
+        """
+        Süreç genelinde paylaşılan kur deposunu geri verir; ilk çağrıda oluşturur.
+        Returns the process-wide store, creating it on first use.
+
+        Returns:
+            FxStore: The shared store.
+        """
+        if cls._shared_instance is None:
+            with cls._shared_lock:
+                if cls._shared_instance is None:
+                    cls._shared_instance = cls()
+        return cls._shared_instance
+
+    def __load(self, pair:str):
+        """
+        Paritenin serisini ve kapsamını bellekten, yoksa diskten okur.
+        Returns the (series, coverage) of the pair from memory, loading it from disk on first use.
+        """
+        if pair not in self.__series:
+            columns = ", ".join(self.COLUMNS.values())
+            with connect(self.path) as conn:
+                row = conn.execute("SELECT baslangic, bitis FROM kur_kapsam WHERE parite = ?", (pair,)).fetchone()
+                df = pd.read_sql_query(f"SELECT tarih, {columns} FROM kurlar WHERE parite = ? ORDER BY tarih", conn, params=(pair,))
+            df.columns = ["TARIH"] + list(self.COLUMNS.keys())
+            df[list(self.COLUMNS.keys())] = df[list(self.COLUMNS.keys())].astype(float)
+            df["TARIH"] = pd.to_datetime(df["TARIH"], format="%Y-%m-%d").astype("datetime64[ns]")
+            coverage = (date.fromisoformat(row[0]), date.fromisoformat(row[1])) if row is not None else None
+            self.__series[pair] = (df, coverage)
+        return self.__series[pair]
+
+    def coverage(self, pair:str):
+        """
+        Depoda ilgili parite için bulunan tarih aralığını geri verir.
+        Returns the (start, end) dates held for the pair, or None if nothing is stored.
+        """
+        with self.__lock:
+            return self.__load(pair)[1]
+
+    def get(self, pair:str, period_1, period_2) -> pd.DataFrame:
+        """
+        Paritenin istenen aralıktaki kurlarını geri verir; yalnızca kapsam dışında kalan baş ve son aralıklar indirilir.
+        Returns the rates of the pair in [period_1, period_2]; only the head/tail outside the stored coverage is downloaded.
+
+        Args:
+            pair (str): Yahoo code of the pair, e.g. "USDTRY=X".
+            period_1 (str | date): Start of the range. String format is dd-mm-YYYY.
+            period_2 (str | date): End of the range. String format is dd-mm-YYYY.
+
+        Returns:
+            pd.DataFrame: TARIH and the price columns of get_prices_from_yahoo() for the range.
+        """
+        start, end = to_date(period_1), to_date(period_2)
+        with self.__lock:
+            df, coverage = self.__load(pair)
+            ranges = missing_ranges(coverage, start, end)
+            if ranges:
+                df, coverage = self.__extend(pair, df, coverage, ranges)
+                self.__series[pair] = (df, coverage)
+
+        mask = (df["TARIH"] >= pd.Timestamp(start)) & (df["TARIH"] <= pd.Timestamp(end))
+        return df.loc[mask].reset_index(drop=True)
+
+    def __extend(self, pair, df, coverage, ranges):
+        """
+        Eksik aralıkları indirir, seriye ekler ve diske yazar.
+        Downloads the missing ranges, merges them into the series and persists them.
+        """
+        fetched_frames = []
+        for range_start, range_end in ranges:
+            # Yahoo period_2 gununu dahil etmez; araligin son gunu icin bir sonraki gun istenir.
+            fetched = self.fetcher.get_prices_from_yahoo(
+                company_code=pair,
+                period_1=range_start.strftime("%d-%m-%Y"),
+                period_2=(range_end + timedelta(days=1)).strftime("%d-%m-%Y"),
+            )
+            fetched = fetched[(fetched["TARIH"] >= pd.Timestamp(range_start)) & (fetched["TARIH"] <= pd.Timestamp(range_end))]
+            fetched_frames.append(fetched[["TARIH"] + list(self.COLUMNS.keys())].astype({"TARIH": df["TARIH"].dtype}))
+        fetched = pd.concat(fetched_frames, ignore_index=True)
+        df = pd.concat([df, fetched], ignore_index=True).drop_duplicates(subset="TARIH", keep="last").sort_values(by="TARIH").reset_index(drop=True)
+
+        extended = coverage
+        for range_start, range_end in ranges:
+            extended = extend_coverage(extended, range_start, range_end)
+        # Kapsam disinda kalan (bugune ait) kurlar diske yazilmaz.
+        stored = fetched.iloc[0:0] if extended is None else fetched[fetched["TARIH"] <= pd.Timestamp(extended[1])]
+        rows = [(pair, tarih, *values) for tarih, values in zip(stored["TARIH"].dt.strftime("%Y-%m-%d"), stored[list(self.COLUMNS.keys())].astype(float).itertuples(index=False, name=None))]
+        placeholders = ", ".join("?" for _ in range(len(self.COLUMNS) + 2))
+        with connect(self.path) as conn:
+            conn.executemany(f"INSERT OR REPLACE INTO kurlar VALUES ({placeholders})", rows)
+            if extended != coverage:
+                conn.execute("INSERT OR REPLACE INTO kur_kapsam VALUES (?, ?, ?)", (pair, extended[0].isoformat(), extended[1].isoformat()))
+        return df, extended
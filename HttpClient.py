@@ -0,0 +1,209 @@
+import time
+import random
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from ResponseCache import ResponseCache
+from RateLimiter import RateLimiter
+
+class HttpClient(object):
+    """
+    Kalıcı (keep-alive) bağlantı havuzu kullanan, thread-safe bir HTTP oturum katmanı.
+    A thread-safe HTTP session layer backed by a pooled, keep-alive connection.
+
+    Her istek için yeni bir TCP+TLS el sıkışması yapmak yerine aynı sunucuya açılan bağlantılar tekrar kullanılır.
+    Bir örnek (instance) scraper'a özel olarak oluşturulabilir ya da HttpClient.shared() ile tüm süreçte paylaşılabilir.
+    Bir ResponseCache verilirse yanıtlar önbellekten sunulur; süresi dolan kayıtlar koşullu isteklerle yeniden doğrulanır.
+    Bir RateLimiter verilirse ağa giden her istek sunucu başına jeton kovasından geçer. 429/5xx yanıtları ve zaman aşımları
+    üstel artan bekleme süresi (exponential backoff) ve rastgele sapma (jitter) ile yeniden denenir.
+
+    Attributes:
+        pool_connections (int): Number of host pools kept by the adapter.
+        pool_maxsize (int): Maximum number of open connections kept per host.
+        timeout (float | tuple): Default (connect, read) timeout in seconds for every request.
+        session (requests.Session): The underlying pooled session.
+        cache (ResponseCache): Optional response cache consulted before the network.
+        rate_limiter (RateLimiter): Optional per-host token-bucket limiter applied to every network request.
+        max_retries (int): Number of retries on 429/5xx answers, timeouts and connection errors.
+        backoff (float): Base delay in seconds of the exponential backoff.
+        max_in_flight (int): Optional limit on the number of requests on the network at the same time, across all threads.
+
+    Methods:
+        shared(cache):
+            Returns the process-wide HttpClient instance, creating it on first use.
+        request(method, url, params, json_payload, headers, timeout, ttl):
+            Sends a request over the pooled session (or serves it from the cache) and returns the response.
+        close():
+            Closes every pooled connection.
+    """
+
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+    DEFAULT_HEADERS = {
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+
+    # shared() cagrisinda cache verilmedigini belirtir; None onbellegi kapatir.
+    _DEFAULT_CACHE = object()
+
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, pool_connections=10, pool_maxsize=20, timeout=(5, 30), cache=None, rate_limiter=None, max_retries=3, backoff=0.5, max_in_flight=None) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_in_flight = max_in_flight
+        # Ic ice thread havuzlari kullanan cagrilarda bile agdaki istek sayisi bu sinirla tutulur.
+        self.__in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight is not None else None
+        self.session = requests.Session()
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        # pool_block=True; havuz doluysa yeni baglanti acmak yerine bos bir baglantinin birakilmasi beklenir.
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @classmethod
+    def shared(cls, cache=_DEFAULT_CACHE):
+        """
+        Süreç genelinde paylaşılan HttpClient örneğini geri verir; ilk çağrıda varsayılan önbellek ve hız sınırlayıcı ile oluşturur.
+        Returns the process-wide HttpClient instance, creating it with the default response cache and rate limiter on first use.
+
+        Args:
+            cache (ResponseCache, optional): Response cache of the shared client; None turns caching off. If given, it also
+                replaces the cache of an existing shared client. Defaults to a ResponseCache in the cache directory (see CacheDir).
+
+        Returns:
+            HttpClient: The shared client.
+        """
+        if cls._shared_instance is not None and cache is cls._DEFAULT_CACHE:
+            return cls._shared_instance
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                # Varsayilan onbellek yalnizca gerektiginde olusturulur; cache=None ile diske hicbir sey yazilmaz.
+                default = ResponseCache() if cache is cls._DEFAULT_CACHE else cache
+                cls._shared_instance = cls(cache=default, rate_limiter=RateLimiter())
+            elif cache is not cls._DEFAULT_CACHE:
+                cls._shared_instance.cache = cache
+        return cls._shared_instance
+
+    def request(self, method, url, params=None, json_payload=None, headers=None, timeout=None, ttl=None):
+        """
+        Havuzlanmış oturum üzerinden bir istek atar ve yanıtı geri verir. Önbellekte geçerli bir kayıt varsa ağa gidilmez.
+        Sends a request over the pooled session and returns the response. Fresh cached responses are served without touching the network.
+
+        Args:
+            method (str): The HTTP method to be used for the request (e.g., 'GET', 'POST').
+            url (str): The URL of the request.
+            params (dict, optional): Query string parameters (default is None).
+            json_payload (dict, optional): The payload data in JSON format, used for POST requests (default is None).
+            headers (dict, optional): Extra headers merged over the session defaults (default is None).
+            timeout (float | tuple, optional): Overrides the default timeout for this request only (default is None).
+            ttl (float, optional): Overrides the cache's time-to-live for this request; 0 bypasses the cache (default is None).
+
+        Returns:
+            requests.Response: The response of the request.
+        """
+        if self.cache is None:
+            return self.__send(method, url, params, json_payload, headers, timeout)
+
+        if ttl is None:
+            ttl = self.cache.ttl_for(method, url, params, json_payload)
+        if not ttl:
+            return self.__send(method, url, params, json_payload, headers, timeout)
+
+        key = self.cache.key(method, url, params, json_payload)
+        entry = self.cache.get(key)
+        if entry is not None and entry["fresh"]:
+            return self.__cached_response(entry, url)
+
+        # Suresi dolmus kayit sunucu destekliyorsa kosullu istekle yeniden dogrulanir.
+        headers = dict(headers or {})
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.__send(method, url, params, json_payload, headers, timeout)
+        if response.status_code == 304 and entry is not None:
+            self.cache.refresh(key, ttl)
+            return self.__cached_response(entry, url)
+        if response.status_code == 200:
+            self.cache.put(key, response, ttl)
+        return response
+
+    def __send(self, method, url, params, json_payload, headers, timeout):
+        """
+        İsteği hız sınırına uyarak ağa gönderir; geçici hatalarda yeniden dener.
+        Sends the request to the network under the rate limit and retries transient failures.
+        """
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url)
+            try:
+                if self.__in_flight is not None:
+                    with self.__in_flight:
+                        response = self.__request(method, url, params, json_payload, headers, timeout)
+                else:
+                    response = self.__request(method, url, params, json_payload, headers, timeout)
+            except (requests.Timeout, requests.ConnectionError):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self.__retry_delay(attempt))
+                continue
+            if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.max_retries:
+                return response
+            time.sleep(self.__retry_delay(attempt, response.headers.get("Retry-After")))
+        return response
+
+    def __request(self, method, url, params, json_payload, headers, timeout):
+        """
+        Tek bir isteği havuzlanmış oturum üzerinden gönderir.
+        Sends a single request over the pooled session.
+        """
+        return self.session.request(
+            method=method,
+            url=url,
+            params=params,
+            json=json_payload,
+            headers=headers,
+            timeout=self.timeout if timeout is None else timeout,
+        )
+
+    def __retry_delay(self, attempt, retry_after=None):
+        """
+        Yeniden deneme öncesi beklenecek süre; sunucu Retry-After gönderdiyse ona uyulur, aksi halde full-jitter backoff kullanılır.
+        Delay before a retry; honours Retry-After when the server sends seconds, otherwise uses full-jitter exponential backoff.
+        """
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        return random.uniform(0, self.backoff * 2 ** attempt)
+
+    @staticmethod
+    def __cached_response(entry, url):
+        """
+        Önbellek kaydından bir requests.Response nesnesi oluşturur.
+        Builds a requests.Response from a cache entry so callers can treat it like a network response.
+        """
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["content"]
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = url
+        return response
+
+    def close(self):
+        """
+        Havuzdaki tüm bağlantıları kapatır.
+        Closes every pooled connection.
+        """
+        self.session.close()
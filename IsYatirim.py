@@ -1,10 +1,26 @@
-import requests
+import re
 import time
+import requests
 import random 
 import json
+import asyncio
+import numpy as np
 import pandas as pd
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from HttpClient import HttpClient
+from JsonBackend import JsonBackend
+from TradingCalendar import TradingCalendar
+from DateRange import split_date_range
+
+# lxml kuruluysa HTML ayristirma C tabanli ayristirici ile yapilir.
+try:
+    import lxml # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 class IsYatirimScraper(object):
     """
@@ -17,25 +33,55 @@ class IsYatirimScraper(object):
         API_URL_TEMETTU_GECMISI (str): URL for retrieving dividend data.
         API_URL_YABANCI_ORANI (str): URL for retrieving foreign exchange rate data.
         API_URL_DEGERLI_METALLER_VE_EMTIA (dict): URLs for retrieving precious metals data.
+        http_client (HttpClient): Pooled keep-alive session used for every request.
+        price_store (PriceStore): Optional on-disk store that get_is_yatirim_price_data() reads from and extends.
+        calendar (TradingCalendar): Trading-day calendar learned from downloaded index (XU100) price responses.
 
     Methods:
-        make_request(method, url, params, json_payload, header):
+        make_request(method, url, params, json_payload, header, timeout, ttl):
             Simply makes a request to given url and returns the response.
-        get_is_yatirim_price_data(ticker, start_date, end_date):
+        get_is_yatirim_price_data(ticker, start_date, end_date, compact, window_days):
             Retrieves historical price data of a given company
+        get_price_panel(tickers, start_date, end_date, workers, pivot, compact):
+            Retrieves historical price data of many companies in parallel as a single panel.
         get_is_yatirim_financial_data(ticker, current_year, cumulative):
             Retrieves financial data; balance-sheet, revenue table and cash-flow of a given company.
+        get_is_yatirim_financial_statements(ticker, current_year):
+            Retrieves financial data once and returns both cumulative and quarterly views.
         get_capital_gain_data(ticker, year):
             Retrieves capital gain data of a given company.
+        get_capital_gain_table(endeks, sektor, refresh_days):
+            Retrieves capital gain data of every company in an index/sector, indexed by ticker.
         get_dividend_data(ticker):
             Retrieves dividend data of a given company
+        parse_dividend_page(html, parser, targeted):
+            Parses the dividend table of a saved or downloaded company card page.
         get_foreign_exchange_rate(ticker, start_date, end_date):
             Retrieves foreign exchange rate of a given company in a time range
-        get_precious_metals_data(parameters, start_date, end_date, rep_type):
+        get_precious_metals_data(parameters, start_date, end_date, rep_type, join):
             Retrieves data for various precious metals such as gold, silver, platin etc.
+        get_daily_quotes(parameters):
+            Retrieves the current OneEndeks quotes as lightweight records.
+        subscribe_daily_quotes(parameters, callback, interval, stop_event, max_polls):
+            Polls OneEndeks and calls the callback with the symbols that changed.
+        compact_price_frame(df, tickers):
+            Returns a copy of a price frame with categorical ticker codes and float32 prices.
+        memory_report(df):
+            Returns the memory used by every column of a price frame or panel.
     """
 
-    def __init__(self) -> None:
+    # compact_price_frame() ile float32'ye cevrilebilen fiyat sutunlari
+    FLOAT32_PRICE_COLUMNS = ["GUN ICI EN DUSUK", "GUN ICI EN YUKSEK", "KAPANIS FIYATI (TL)", "ENDEKS BAZLI FIYAT", "DOLAR BAZLI FIYAT (USD)"]
+    # Tum hisselerde ayni olan, compact panelde bir kez tutulan seriler
+    SHARED_PRICE_COLUMNS = ["ENDEKS DEGERI (BIST100)", "DOLAR KURU (TL)"]
+
+    def __init__(self, http_client=None, price_store=None, calendar=None) -> None:
+        # Verilmezse surec genelinde paylasilan oturum kullanilir.
+        self.http_client = http_client if http_client is not None else HttpClient.shared()
+        # Verilirse fiyatlar yerel depodan okunur, yalnizca eksik araliklar API'den istenir.
+        self.price_store = price_store
+        # Indirilen endeks (XU100) fiyat verilerindeki islem gunleri bu takvime ogretilir.
+        self.calendar = calendar if calendar is not None else TradingCalendar.shared()
         # Gerekli API URL'leri
         self.API_URL_FIYAT = "https://www.isyatirim.com.tr/_layouts/15/Isyatirim.Website/Common/Data.aspx/HisseTekil"
         self.API_URL_MALI_TABLO = "https://www.isyatirim.com.tr/_layouts/15/IsYatirim.Website/Common/Data.aspx/MaliTablo"
@@ -47,7 +93,7 @@ class IsYatirimScraper(object):
             "daily": f'https://www.isyatirim.com.tr/_layouts/15/Isyatirim.Website/Common/Data.aspx/OneEndeks'
         }
         
-    def make_request(self, method, url, params=None, json_payload=None, headers=None):
+    def make_request(self, method, url, params=None, json_payload=None, headers=None, timeout=None, ttl=None):
         """
         Makes a request to the specified API URL and returns its content.
         Belirtilen/verilen API URL'sine bir istek yapar ve içeriğini döndürür/geri verir.
@@ -58,6 +104,8 @@ class IsYatirimScraper(object):
             params (dict, optional): The required parameters to retrieve data (default is None).
             json_payload (dict, optional): The payload data in JSON format, used for POST requests (default is None).
             headers (dict, optional): The required headers to be used for successful requests (default is None).
+            timeout (float | tuple, optional): Per-request timeout in seconds; the client's default is used if None.
+            ttl (float, optional): Overrides the response cache's time-to-live; 0 always goes to the network (default is None).
 
         Returns:
             Union[dict, None]: The response data if the request is successful; otherwise, None.
@@ -71,10 +119,14 @@ class IsYatirimScraper(object):
         response = None
         timestamp = int(time.time())
         headers = {"User-Agent":f"{random.choice(user_agents)} {timestamp}"}
-        if method == "GET":
-            response = requests.get(url, params=params, headers=headers)
-        elif method == "POST":
-            response = requests.post(url, json=json_payload, headers=headers)
+        try:
+            if method == "GET":
+                response = self.http_client.request("GET", url, params=params, headers=headers, timeout=timeout, ttl=ttl)
+            elif method == "POST":
+                response = self.http_client.request("POST", url, json_payload=json_payload, headers=headers, timeout=timeout, ttl=ttl)
+        except requests.RequestException as e:
+            print(f"Failed to make request. Error: {e}")
+            return None
         
         if response is None:
             print("Failed to make request. No response recieved.")
@@ -86,20 +138,9 @@ class IsYatirimScraper(object):
                 return response.content
 
             try:
-                data = response.json()
-
-                if "value" in data:
-                    return data["value"]
-            
-                if "d" in data:
-                    if isinstance(data["d"], str):
-                        return json.loads(data["d"])
-                    else:
-                        return data["d"]
-                if "data" in data:
-                    return data["data"]
-                return data # returns directly if no special process needed
-            except json.JSONDecodeError:
+                # Zarf ("value"/"d"/"data") ve "d" icindeki ikinci JSON katmani JsonBackend'de acilir.
+                return JsonBackend.shared().decode(response.content)
+            except ValueError:
                 print("Failed to decode JSON data.")
         else:
             print(f"Failed to fecth data. Status code: {response.status_code}")
@@ -145,19 +186,155 @@ class IsYatirimScraper(object):
         df["TARIH"] = pd.to_datetime(df["TARIH"], format="%d-%m-%Y")
         return df
 
-    def get_is_yatirim_price_data(self, ticker:str, start_date:str, end_date:str) -> json:
+    def get_is_yatirim_price_data(self, ticker:str, start_date:str, end_date:str, compact=False, window_days=365) -> json:
         """
         Retrieves historical price data for the specified stock code from the API and returns it as a JSON object.
         Belirtilen hisse kodu için API'den geçmiş fiyat verilerini alır ve bunları bir JSON nesnesi olarak döndürür/geri verir.
 
+        If a PriceStore was given to the scraper, only the ranges missing from the store are requested from the API.
+        If any of them cannot be downloaded, None is returned instead of the partial data in the store.
+
         Args:
             ticker (str): The stock code of the requested company.
             start_date (str): The start date for retrieving historical price data. Valid format is dd-mm-YYYY.
             end_date (str): The end date for retrieving historical price data. Valid format is dd-mm-YYYY.
+            compact (bool, optional): Return the frame with compact dtypes, see compact_price_frame(). Defaults to False.
+            window_days (int, optional): Longer ranges are split into windows of this many days that are downloaded
+                concurrently and stitched together. None downloads the range in a single request. Defaults to 365.
 
         Returns:
             json: A JSON object containing the necessary information to be processed by the helper function __process_is_yatirim_price_data().
         """
+        if self.price_store is None:
+            df = self.__download_price_data(ticker=ticker, start_date=start_date, end_date=end_date, window_days=window_days)
+        else:
+            # Depoda bulunmayan bas/son araliklar indirilir, geri kalani diskten okunur.
+            downloaded, failed = False, []
+            for range_start, range_end in self.price_store.missing_ranges(ticker=ticker, start_date=start_date, end_date=end_date):
+                df = self.__download_price_data(ticker=ticker, start_date=range_start.strftime("%d-%m-%Y"), end_date=range_end.strftime("%d-%m-%Y"), window_days=window_days)
+                if df is not None:
+                    self.price_store.write(ticker=ticker, df=df, start_date=range_start, end_date=range_end)
+                    downloaded = True
+                else:
+                    failed.append(f"{range_start.strftime('%d-%m-%Y')}/{range_end.strftime('%d-%m-%Y')}")
+            # Eksik bir aralik indirilemediyse depodaki kismi veri tam veri gibi geri verilmez.
+            if failed:
+                print(f"{ticker} icin fiyat verisi alinamayan araliklar: {failed}")
+                return None
+            if not downloaded and self.price_store.coverage(ticker) is None:
+                return None
+            df = self.price_store.read(ticker=ticker, start_date=start_date, end_date=end_date)
+        if compact and df is not None:
+            df = self.compact_price_frame(df)
+        return df
+
+    @staticmethod
+    def compact_price_frame(df:pd.DataFrame, tickers=None) -> pd.DataFrame:
+        """
+        Returns a copy of a processed price frame with compact dtypes.
+        İşlenmiş bir fiyat tablosunun daha az bellek kullanan veri tipleriyle bir kopyasını geri verir.
+
+        HISSE KODU becomes categorical and price columns become float32 when every value survives the round trip at
+        the 4-decimal precision of the source; otherwise the column stays float64. Volume, index value and USD rate
+        are kept as float64.
+
+        Args:
+            df (pd.DataFrame): Processed price data as returned by get_is_yatirim_price_data().
+            tickers (list, optional): Categories of HISSE KODU; frames that share them can be concatenated without
+                losing the categorical dtype. Defaults to the tickers in the frame.
+
+        Returns:
+            pd.DataFrame: The compacted copy.
+        """
+        df = df.copy()
+        df["HISSE KODU"] = pd.Categorical(df["HISSE KODU"], categories=tickers)
+        for column in IsYatirimScraper.FLOAT32_PRICE_COLUMNS:
+            if column not in df.columns:
+                continue
+            values = df[column].to_numpy(dtype=np.float64)
+            compacted = values.astype(np.float32)
+            # float32 yalnizca kaynak hassasiyeti (4 ondalik) korunuyorsa kullanilir.
+            if np.array_equal(np.round(compacted.astype(np.float64), 4), np.round(values, 4), equal_nan=True):
+                df[column] = compacted
+        return df
+
+    @staticmethod
+    def memory_report(df:pd.DataFrame) -> pd.DataFrame:
+        """
+        Returns the memory used by every column of a price frame or panel, including the shared series stored in attrs.
+        Bir fiyat tablosunun veya panelin sütun bazında kullandığı belleği, attrs içindeki ortak seriler dahil geri verir.
+
+        Args:
+            df (pd.DataFrame): A price frame or panel.
+
+        Returns:
+            pd.DataFrame: dtype and size in bytes and megabytes per column, with a TOPLAM row.
+        """
+        usage = df.memory_usage(deep=True)
+        report = pd.DataFrame({"dtype": [str(df.index.dtype)] + [str(dtype) for dtype in df.dtypes], "bytes": usage.to_numpy()}, index=usage.index)
+        shared = df.attrs.get("ortak_seriler")
+        if shared is not None:
+            shared_usage = shared.memory_usage(deep=True)
+            report = pd.concat([report, pd.DataFrame(
+                {"dtype": [str(shared.index.dtype)] + [str(dtype) for dtype in shared.dtypes], "bytes": shared_usage.to_numpy()},
+                index=[f"ortak_seriler/{name}" for name in shared_usage.index],
+            )])
+        report.loc["TOPLAM"] = ["", report["bytes"].sum()]
+        report["MB"] = report["bytes"] / 1024 ** 2
+        return report
+
+    def __download_price_data(self, ticker:str, start_date:str, end_date:str, window_days=365) -> pd.DataFrame:
+        """
+        Downloads historical price data from the API without using the price store.
+        Fiyat deposunu kullanmadan API'den geçmiş fiyat verilerini indirir. Uzun aralıklar pencerelere bölünerek eşzamanlı indirilir.
+
+        Args:
+            ticker (str): The stock code of the requested company.
+            start_date (str): The start date. Valid format is dd-mm-YYYY.
+            end_date (str): The end date. Valid format is dd-mm-YYYY.
+            window_days (int, optional): Maximum length of a single request in days; None for a single request. Defaults to 365.
+
+        Returns:
+            pd.DataFrame: Processed price data, or None if the request fails.
+        """
+        if window_days is None:
+            windows = [(start_date, end_date)]
+        else:
+            windows = [(start.strftime("%d-%m-%Y"), end.strftime("%d-%m-%Y")) for start, end in split_date_range(start_date, end_date, window_days)]
+        download = lambda window: self.__download_price_window(ticker=ticker, start_date=window[0], end_date=window[1])
+        if len(windows) <= 1:
+            df = download((start_date, end_date))
+        else:
+            # Pencereler eszamanli indirilir; basarisiz olanlar tek tek bir kez daha denenir.
+            with ThreadPoolExecutor(max_workers=min(len(windows), 8)) as executor:
+                frames = list(executor.map(download, windows))
+            frames = [frame if frame is not None else download(window) for frame, window in zip(frames, windows)]
+            if any(frame is None for frame in frames):
+                failed = [f"{window[0]}/{window[1]}" for frame, window in zip(frames, windows) if frame is None]
+                print(f"{ticker} icin fiyat verisi alinamayan araliklar: {failed}")
+                return None
+            # Pencere sinirlarinda tekrar eden gunler atilir.
+            df = pd.concat(frames, ignore_index=True).drop_duplicates(subset="TARIH").sort_values(by="TARIH", kind="stable").reset_index(drop=True)
+        if ticker == self.calendar.INDEX_TICKER and df is not None and not df.empty:
+            # Takvim yalnizca endeks verisinden ogrenilir; islem yasagi olan bir hissenin bos gunleri tatil sayilmaz.
+            # Bugun henuz kesinlesmedigi icin takvime en fazla dunku gun ogretilir.
+            learned_until = datetime.combine(datetime.today().date() - timedelta(days=1), datetime.min.time())
+            self.calendar.learn(df.loc[df["TARIH"] <= learned_until, "TARIH"], start=start_date, end=min(datetime.strptime(end_date, "%d-%m-%Y"), learned_until))
+        return df
+
+    def __download_price_window(self, ticker:str, start_date:str, end_date:str) -> pd.DataFrame:
+        """
+        Downloads and processes one HisseTekil request.
+        Tek bir HisseTekil isteğini indirir ve işler.
+
+        Args:
+            ticker (str): The stock code of the requested company.
+            start_date (str): The start date. Valid format is dd-mm-YYYY.
+            end_date (str): The end date. Valid format is dd-mm-YYYY.
+
+        Returns:
+            pd.DataFrame: Processed price data, or None if the request fails.
+        """
         # Necessary parameters
         params = {
             "hisse": ticker,            
@@ -172,6 +349,72 @@ class IsYatirimScraper(object):
         if data is not None:
             return self.__process_is_yatirim_price_data(data=data)
         
+    def get_price_panel(self, tickers:list, start_date:str, end_date:str, workers=8, pivot=None, compact=False) -> pd.DataFrame:
+        """
+        Retrieves historical price data for many companies in parallel and returns them as a single panel.
+        Birden fazla hisse için tarihsel fiyat verilerini paralel olarak alır ve tek bir panel olarak döndürür/geri verir.
+
+        Args:
+            tickers (list): The stock codes of the requested companies.
+            start_date (str): The start date for retrieving historical price data. Valid format is dd-mm-YYYY.
+            end_date (str): The end date for retrieving historical price data. Valid format is dd-mm-YYYY.
+            workers (int, optional): Number of parallel requests. Defaults to 8.
+            pivot (str, optional): None for the long-format panel (TARIH, HISSE KODU, ...), "close" for a closing price matrix
+                or "volume" for a volume matrix indexed by TARIH with one column per ticker. Defaults to None.
+            compact (bool, optional): Use compact dtypes (see compact_price_frame()) and store the index value and USD rate,
+                which are the same for every ticker, once in panel.attrs["ortak_seriler"] instead of once per row. Defaults to False.
+
+        Returns:
+            pd.DataFrame: The price panel. Tickers that could not be fetched are listed in panel.attrs["failed"].
+        """
+        if pivot not in [None, "close", "volume"]:
+            raise ValueError(f"Hatali pivot degeri: {pivot}. Gecerli secenekler: None, 'close', 'volume'")
+
+        frames, failed = {}, []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.get_is_yatirim_price_data, ticker=ticker, start_date=start_date, end_date=end_date): ticker
+                for ticker in tickers
+            }
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    print(f"{ticker} icin fiyat verisi alinamadi. Hata: {e}")
+                    df = None
+                if df is None or df.empty:
+                    failed.append(ticker)
+                else:
+                    frames[ticker] = df
+        failed = [ticker for ticker in tickers if ticker in failed]
+        if failed:
+            print(f"Fiyat verisi alinamayan hisseler: {failed}")
+
+        # Tek seferde birlestirilir; hisseler istenen sirada tutulur.
+        ordered = [frames[ticker] for ticker in tickers if ticker in frames]
+        shared = None
+        if compact:
+            # Endeks degeri ve dolar kuru tum hisselerde aynidir; panelde tarih bazinda bir kez tutulur.
+            shared = pd.concat([df[["TARIH"] + self.SHARED_PRICE_COLUMNS] for df in ordered]) if ordered else pd.DataFrame(columns=["TARIH"] + self.SHARED_PRICE_COLUMNS)
+            shared = shared.drop_duplicates(subset="TARIH").set_index("TARIH").sort_index()
+            categories = [ticker for ticker in tickers if ticker in frames]
+            ordered = [self.compact_price_frame(df.drop(columns=self.SHARED_PRICE_COLUMNS), tickers=categories) for df in ordered]
+        if ordered:
+            panel = pd.concat(ordered, ignore_index=True)
+        else:
+            panel = pd.DataFrame(columns=['TARIH', 'HISSE KODU', 'GUN ICI EN DUSUK', 'GUN ICI EN YUKSEK', 'KAPANIS FIYATI (TL)', 'ENDEKS DEGERI (BIST100)', 'ENDEKS BAZLI FIYAT', 'DOLAR KURU (TL)', 'DOLAR BAZLI FIYAT (USD)', 'HACIM (TL)'])
+            if compact:
+                panel = panel.drop(columns=self.SHARED_PRICE_COLUMNS)
+
+        if pivot is not None:
+            value_column = "KAPANIS FIYATI (TL)" if pivot == "close" else "HACIM (TL)"
+            panel = panel.pivot(index="TARIH", columns="HISSE KODU", values=value_column)
+        panel.attrs["failed"] = failed
+        if shared is not None:
+            panel.attrs["ortak_seriler"] = shared
+        return panel
+
     def __process_financial_data(self, data, params:dict) -> pd.DataFrame:
         """
         Processes financial data retrieved from the API and returns a DataFrame containing 20 quarters/5 years.
@@ -205,25 +448,24 @@ class IsYatirimScraper(object):
         data = data.astype('int64')
         return data
     
-    def get_is_yatirim_financial_data(self, ticker:str, current_year:int, cumulative=True):
+    def __fetch_financial_data(self, ticker:str, current_year:int) -> pd.DataFrame:
         """
-        Retrieves financial data including balance-sheet, revenue table, and cash-flow for 20 quarters and returns as a JSON object.
-        20 çeyrek için bilanço, gelir tablosu ve nakit akışı da dahil olmak üzere finansal verileri alır ve JSON nesnesi olarak döndürür.
+        Downloads the cumulative financial statements for 16 quarters and returns them as a single DataFrame.
+        16 çeyreğe ait kümülatif finansal tabloları indirir ve tek bir DataFrame olarak döndürür.
 
         Args:
             ticker (str): Stock code of the requested company.
             current_year (int): The current year for which financial data is requested.
-            cumulative (bool, optional): Whether to retrieve cumulative financial data. Defaults to True.
 
         Returns:
-            dict: A JSON object containing financial data.
+            pd.DataFrame: Cumulative financial data; "ACIKLAMA" column followed by one column per quarter, newest first.
         """
         # preparing time objects
         years = range(current_year - 3, current_year+1) # last 5 years
         quarters = [3, 6, 9, 12]
         time_range = sorted([(q,y) for q in reversed(quarters) for y in years], key=lambda x:x[1], reverse=True)
 
-        all_data_frames = []
+        all_params = []
         # preparing parameters
         for time_index in range(0, len(time_range), 4):
             time_ = time_range[time_index:time_index+4]
@@ -236,7 +478,15 @@ class IsYatirimScraper(object):
             for i, (quarter, year) in enumerate(time_, start=1):
                 params[f"year{i}"] = str(year)
                 params[f"period{i}"] = str(quarter)
-            data = self.make_request(method="GET", url=self.API_URL_MALI_TABLO, params=params)
+            all_params.append(params)
+
+        # Donemler birbirinden bagimsiz oldugu icin istekler eszamanli atilir; executor.map sonuclari zaman sirasinda geri verir.
+        with ThreadPoolExecutor(max_workers=len(all_params)) as executor:
+            responses = executor.map(lambda params: self.make_request(method="GET", url=self.API_URL_MALI_TABLO, params=params), all_params)
+            responses = list(responses)
+
+        all_data_frames = []
+        for params, data in zip(all_params, responses):
             if data:
                 all_data_frames.append(self.__process_financial_data(data=data, params=params))
         
@@ -248,27 +498,84 @@ class IsYatirimScraper(object):
         df = df.reset_index()
         df.columns = ["ACIKLAMA"] + list(df.columns[1:])                
         
+        return df
+
+    def __decumulate_financial_data(self, df:pd.DataFrame) -> pd.DataFrame:
+        """
+        Converts cumulative (year-to-date) financial data into quarterly figures with a single array operation.
+        Kümülatif (yıl başından itibaren) finansal verileri tek bir dizi işlemiyle çeyreklik verilere dönüştürür.
+
+        Each quarter is reduced by the previous quarter of the same fiscal year (12/Y - 9/Y, 9/Y - 6/Y, 6/Y - 3/Y);
+        first quarters are kept as they are.
+
+        Args:
+            df (pd.DataFrame): Cumulative financial data as returned by __fetch_financial_data().
+
+        Returns:
+            pd.DataFrame: Quarterly financial data with the same columns.
+        """
+        columns = list(df.columns[1:])
+        positions = {col: i for i, col in enumerate(columns)}
+        # Her ceyrek icin ayni mali yildaki bir onceki ceyregin sutun sirasi; ilk ceyrekler icin -1, bulunamayanlar icin -2
+        previous = []
+        for col in columns:
+            quarter, year = col.split("/")
+            if quarter == "3":
+                previous.append(-1)
+            else:
+                previous.append(positions.get(f"{int(quarter) - 3}/{year}", -2))
+        previous = np.array(previous, dtype=int)
+        values = df[columns].to_numpy()
+        quarterly = values.copy()
+        has_previous = previous >= 0
+        quarterly[:, has_previous] -= values[:, previous[has_previous]]
+        missing = previous == -2
+        if missing.any():
+            # Onceki ceyregi olmayan donemler hesaplanamaz.
+            print(f"Firma son zamanlarda halka arz oldugundan gecmis veriler tam olarak alinamadi.")
+            quarterly[:, missing] = 0
+
+        new_df = pd.DataFrame(data=quarterly, columns=columns, index=df.index)
+        new_df.insert(0, "ACIKLAMA", df["ACIKLAMA"])
+        return new_df
+
+    def get_is_yatirim_financial_statements(self, ticker:str, current_year:int):
+        """
+        Retrieves financial data once and returns both the cumulative and the quarterly views.
+        Finansal verileri tek seferde alır; hem kümülatif hem de çeyreklik tabloları döndürür.
+
+        Args:
+            ticker (str): Stock code of the requested company.
+            current_year (int): The current year for which financial data is requested.
+
+        Returns:
+            tuple: (cumulative, quarterly) financial data as pandas DataFrames.
+        """
+        df = self.__fetch_financial_data(ticker=ticker, current_year=current_year)
+        return df, self.__decumulate_financial_data(df)
+
+    def get_is_yatirim_financial_data(self, ticker:str, current_year:int, cumulative=True):
+        """
+        Retrieves financial data including balance-sheet, revenue table, and cash-flow for 20 quarters and returns as a JSON object.
+        20 çeyrek için bilanço, gelir tablosu ve nakit akışı da dahil olmak üzere finansal verileri alır ve JSON nesnesi olarak döndürür.
+
+        Args:
+            ticker (str): Stock code of the requested company.
+            current_year (int): The current year for which financial data is requested.
+            cumulative (bool, optional): Whether to retrieve cumulative financial data. Defaults to True.
+
+        Returns:
+            dict: A JSON object containing financial data.
+        """
+        df = self.__fetch_financial_data(ticker=ticker, current_year=current_year)
         if cumulative:
             return df
-        else:
-            new_df = pd.DataFrame(data=0, columns=df.columns[:-2], index=df.index)
-            new_df["ACIKLAMA"] = df["ACIKLAMA"]
-            try:
-                for col in df.columns[1:]:
-                    if '3/' in col:
-                        new_df[col] = df[col]
-                for col in df.columns[1:]:
-                    if '3/' not in col:
-                        new_df[col] = df[col] - df[df.columns[df.columns.get_loc(col) + 1]]
-            except Exception:
-                print(f"Firma son zamanlarda halka arz oldugundan gecmis veriler tam olarak alinamadi.")
-                return new_df
-            return new_df
+        return self.__decumulate_financial_data(df)
 
     def __process_capital_gain_data(self, data:list) -> pd.DataFrame:
         """
         Processes the capital gain data and returns a processed DataFrame.
-        Sermaye artışı verilerini işler ve düzenlenmiş bir DataFrame döndürür. Sadece get_capital_gain_data() yöntemi içinde kullanılmak üzere tasarlanmıştır.
+        Sermaye artışı verilerini işler ve düzenlenmiş bir DataFrame döndürür. Sadece get_capital_gain_data() ve get_capital_gain_table() yöntemleri içinde kullanılmak üzere tasarlanmıştır.
         
         Args:
             data (list): List of capital gain data.
@@ -298,13 +605,14 @@ class IsYatirimScraper(object):
         desired_order = ['HISSE KODU', 'TARIH', 'BOLUNME SONRASI SERMAYE (TL)', 'BEDELLI ORAN (%)', 'BEDELLI NOMINAL TUTAR (TL)', 'DIGER (%)', 'BEDELSIZ IK ORANI (%)', 'BEDELSIZ TEMETTU ORANI']
         # Reindex the DataFrame with the desired order of columns
         df = df.reindex(columns=desired_order)
-        # From unix-time to regular time unit.
-        df["TARIH"] = df["TARIH"].apply(lambda timestamp: "Açıklanmadı" if timestamp < 0 else pd.to_datetime(timestamp / 1000, unit="s").date()) # Negative timestamps are used as NOT ANNOUNCED/Açıklanmadı in isyatirim website.
-        df = pd.concat([
-            df[df["TARIH"] == "Açıklanmadı"],
-            df[df["TARIH"] != "Açıklanmadı"].sort_values(by=["TARIH"], ascending=False) #[::-1],
-        ])
-        return df.reset_index(drop=True) 
+        # From unix-time to regular time unit in a single vectorized pass.
+        timestamps = pd.to_numeric(df["TARIH"])
+        announced = timestamps >= 0 # Negative timestamps are used as NOT ANNOUNCED/Açıklanmadı in isyatirim website.
+        dates = pd.to_datetime(timestamps.where(announced), unit="ms").dt.date
+        df["TARIH"] = dates.astype(object).where(announced, "Açıklanmadı")
+        # Aciklanmayanlar en ustte, geri kalanlar yeniden eskiye siralanir.
+        order = pd.DataFrame({"announced": announced, "timestamp": timestamps}).sort_values(by=["announced", "timestamp"], ascending=[True, False], kind="stable").index
+        return df.loc[order].reset_index(drop=True) 
 
     def get_capital_gain_data(self, ticker: str, year=0):
         """
@@ -329,6 +637,56 @@ class IsYatirimScraper(object):
         json_data = self.make_request(method="POST", url=self.API_URL_SERMAYE_ARTIRIMLARI, json_payload=payload)
         return self.__process_capital_gain_data(data=json_data)
     
+    def get_capital_gain_table(self, endeks="09", sektor="", refresh_days=1) -> pd.DataFrame:
+        """
+        Retrieves the capital gain history of every company in an index/sector in one request and returns it indexed by ticker.
+        Bir endeks/sektördeki tüm şirketlerin sermaye artırımı geçmişini tek istekle alır ve hisse koduna göre indekslenmiş olarak döndürür.
+
+        If a PriceStore was given to the scraper the table is cached on disk. The first call downloads every year;
+        later calls only download the years since the last refresh and the not-yet-announced actions.
+
+        Args:
+            endeks (str, optional): isyatirim index code. Defaults to "09".
+            sektor (str, optional): isyatirim sector code; "" for all sectors. Defaults to "".
+            refresh_days (int, optional): The cached table is refreshed if it is older than this many days. Defaults to 1.
+
+        Returns:
+            pd.DataFrame: Capital gain data of every company, indexed by HISSE KODU.
+        """
+        def fetch(year, zaman="HEPSI"):
+            payload = {
+                "hisseKodu": "", # Bos hisse kodu ile secilen endeks/sektordeki tum hisseler gelir.
+                "hisseTanimKodu": "",
+                "yil": year,
+                "zaman": zaman,
+                "endeksKodu": endeks,
+                "sektorKodu": sektor,
+            }
+            return self.make_request(method="POST", url=self.API_URL_SERMAYE_ARTIRIMLARI, json_payload=payload)
+
+        universe = f"{endeks}/{sektor}"
+        if self.price_store is None:
+            data = pd.DataFrame(fetch(year=0) or [])
+        else:
+            updated = self.price_store.capital_gains_updated(universe)
+            if updated is None:
+                data = fetch(year=0)
+                if data is not None:
+                    self.price_store.write_capital_gains(universe, data)
+            elif (datetime.today().date() - updated).days >= refresh_days:
+                # Son guncellemeden bu yana gecen yillar ve planlanan islemler yeniden indirilir.
+                years = list(range(updated.year, datetime.today().year + 1))
+                calls = [(year, "HEPSI") for year in years] + [(0, "Planlanan")]
+                with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+                    responses = list(executor.map(lambda call: fetch(*call), calls))
+                if all(response is not None for response in responses):
+                    self.price_store.write_capital_gains(universe, [record for response in responses for record in response], years=years)
+            data = self.price_store.read_capital_gains(universe)
+
+        df = self.__process_capital_gain_data(data=data)
+        # Hisse bazinda siralama korunarak hisse koduna gore indekslenir.
+        return df.sort_values(by="HISSE KODU", kind="stable").set_index("HISSE KODU")
+
     def get_dividend_data(self, ticker:str) -> pd.DataFrame:
         """
         Retrieves historical dividend information for a given company from isyatirim.com.tr.
@@ -344,7 +702,46 @@ class IsYatirimScraper(object):
         """
 
         URL = self.API_URL_TEMETTU_GECMISI + ticker
-        parsed = BeautifulSoup(self.make_request(method="GET", url=URL), "html.parser")
+        html = self.make_request(method="GET", url=URL)
+        if html is None:
+            return None
+        return self.parse_dividend_page(html=html)
+
+    @staticmethod
+    def parse_dividend_page(html:str, parser=None, targeted=True) -> pd.DataFrame:
+        """
+        Parses the dividend table of a sirket-karti.aspx page.
+        Bir sirket-karti.aspx sayfasındaki temettü tablosunu ayrıştırır. Varsayılan olarak sayfanın tamamı yerine yalnızca
+        temettü tablosunun bulunduğu bölüm, kuruluysa lxml ile ayrıştırılır; tablo bulunamazsa tüm sayfa ayrıştırılır.
+
+        Args:
+            html (str | bytes): Content of the company card page.
+            parser (str, optional): BeautifulSoup parser backend. Defaults to lxml if it is installed, otherwise html.parser.
+            targeted (bool, optional): Parse only the dividend table fragment. Defaults to True.
+
+        Returns:
+            pd.DataFrame: A pandas DataFrame containing historical dividend data.
+        """
+        parser = parser or HTML_PARSER
+        parsed = None
+        if targeted:
+            # make_request HTML sayfalarini bytes olarak dondurur; parca, sayfanin kendi karakter kodlamasiyla cozulur.
+            if isinstance(html, bytes):
+                charset = re.search(rb"charset=[\"']?([\w-]+)", html[:4096])
+                try:
+                    html = html.decode(charset.group(1).decode() if charset else "utf-8", errors="replace")
+                except LookupError:
+                    html = html.decode("utf-8", errors="replace")
+            # Temettu tablosu metin uzerinde bulunur; yalnizca <table ...>...</table> parcasi ayristirilir.
+            marker = html.find('data-csvname="temettugercek"')
+            table_start = html.rfind("<table", 0, marker) if marker != -1 else -1
+            table_end = html.find("</table>", marker) if table_start != -1 else -1
+            if table_end != -1:
+                parsed = BeautifulSoup(html[table_start:table_end + len("</table>")], parser)
+                if not parsed.select(selector='table[data-csvname="temettugercek"] th'):
+                    parsed = None
+        if parsed is None:
+            parsed = BeautifulSoup(html, "html.parser")
         
         # Getting column names in a list
         dividend_table = parsed.select(selector='table.dataTable.hover.nowrap.excelexport[data-csvname="temettugercek"]')
@@ -368,31 +765,76 @@ class IsYatirimScraper(object):
         df = df.rename(columns=col_mapping)
         return df[["HISSE KODU", "DAGITIM TARIHI", "DAGITIM GUNU", "HISSE BASI TEM. BRUT (TL)", "TOPLAM TEMETTU (TL)", "DAGITMA ORANI (%)"]]
     
-    def __date_edit(self, current_date, increment_factor):
+    def __probe_in_brackets(self, candidates:list, probe, first_bracket=4, max_bracket=32):
         """
-        Converts a string datetime object to a datetime object, increments it by one, and returns it as a string-datetime object.
-        Bir string-datetime nesnesini bir datetime nesnesine dönüştürür, bir birim artırır ve sonucu string-datetime olarak döndürür.
-        
+        Aday tarihleri sırayla, her turda iki katına çıkan eşzamanlı gruplar halinde dener ve sonuç veren ilk tarihi geri verir.
+        Probes the candidate dates in order, in concurrent brackets that double in size each round, and returns the first date that yields data.
+
+        Her grup, grup boyutunda bir iş parçacığı havuzunda çalışır. Bir tarih sonuç verdiğinde ondan sonraki, henüz
+        başlamamış denemeler iptal edilir ve yeni grup açılmaz.
+
         Args:
-            current_date (str): The current date in string-datetime format.
-            increment_factor: The factor by which the date will be incremented.
+            candidates (list): Candidate dates ordered by priority (nearest first).
+            probe (callable): Function that takes a date and returns the API response for it.
+            first_bracket (int, optional): Number of dates probed in the first round. Defaults to 4.
+            max_bracket (int, optional): Upper limit of the bracket size, and so of the concurrent probes. Defaults to 32.
 
         Returns:
-            str: The modified date in string-datetime format.
+            tuple: (date, response) of the first candidate that returned data, or (None, None).
         """
+        index, size = 0, first_bracket
+        while index < len(candidates):
+            bracket = candidates[index:index+size]
+            executor = ThreadPoolExecutor(max_workers=len(bracket))
+            futures = [executor.submit(probe, candidate) for candidate in bracket]
+            positions = {future: position for position, future in enumerate(futures)}
+            found = None
+            try:
+                for future in as_completed(futures):
+                    position = positions[future]
+                    if future.cancelled() or (found is not None and position > found):
+                        continue
+                    if future.result():
+                        found = position
+                        # Daha sonraki adaylar artik gereksiz; baslamamis olanlar iptal edilir.
+                        for later in futures[position + 1:]:
+                            later.cancel()
+                    # Oncelikli adaylarin tamami bittiyse sonuc kesinlesmistir.
+                    if found is not None and all(earlier.done() for earlier in futures[:found]):
+                        break
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+            if found is not None:
+                return bracket[found], futures[found].result()
+            index += size
+            size = min(size * 2, max_bracket)
+        return None, None
+
+    def __snap_to_trading_days(self, ticker:str, start:datetime, end:datetime):
+        """
+        Verilen aralığı, hissenin fiyat verisindeki en yakın işlem günlerine daraltır.
+        Snaps the range to the nearest trading days. If the trading-day calendar does not cover the range, the index
+        prices of the range are downloaded to teach it; if it still does not, the days are taken from the company's
+        price data, which is not taught to the calendar.
+
+        Returns:
+            tuple: (first trading day >= start, last trading day <= end) as datetime objects, or None.
+        """
+        if not self.calendar.covers(start, end):
+            self.__download_price_data(ticker=self.calendar.INDEX_TICKER, start_date=start.strftime('%d-%m-%Y'), end_date=end.strftime('%d-%m-%Y'))
+        if self.calendar.covers(start, end):
+            first = self.calendar.next_trading_day(start, inclusive=True)
+            last = self.calendar.previous_trading_day(end, inclusive=True)
+            if first is None or last is None or first > last:
+                return None
+            return first.to_pydatetime(), last.to_pydatetime()
+
+        price_df = self.get_is_yatirim_price_data(ticker=ticker, start_date=start.strftime('%d-%m-%Y'), end_date=end.strftime('%d-%m-%Y'))
+        if price_df is None or price_df.empty:
+            return None
+        trading_days = price_df["TARIH"].sort_values()
+        return trading_days.iloc[0].to_pydatetime(), trading_days.iloc[-1].to_pydatetime()
 
-        date_form = '%d-%m-%Y'
-        try:
-            datetime_obj = datetime.strptime(current_date, date_form)
-        except:
-            print(f'Hatali tarih formati. Dogru format: dd-mm-yyyy. Duzeltilmesi gereken tarih: {current_date}')
-            return None 
-        if increment_factor == 1:
-            new_dt = datetime_obj + timedelta(days=1) # increment current date by 1.
-        elif increment_factor == -1:
-            new_dt = datetime_obj - timedelta(days=1) # increment current date by -1.
-        return datetime.strftime(new_dt.date(), date_form)
-        
     def get_foreign_exchange_rate(self, ticker:str, start_date, end_date): # tarihler ddmmyy olarak girilecek.
         """
         Retrieves the foreign exchange rate for the requested company within the specified time range.
@@ -416,43 +858,46 @@ class IsYatirimScraper(object):
         response = self.make_request(method="POST", url=self.API_URL_YABANCI_ORANI, json_payload=json_params)
         if not response: # if there is no result, it returns an empty list
             print("Belirtilen tarihlere ait yabanci takas orani bulunamamistir.\nEn yakin tarihler deneniyor...")    
-            date_info = json_params['baslangicTarih'], json_params['bitisTarihi']
-            df_dict = {}
             try:
-                day_obj = datetime.strptime(json_params['bitisTarihi'], '%d-%m-%Y') - datetime.strptime(json_params['baslangicTarih'], '%d-%m-%Y')
-                day_obj = day_obj.days # Istenen tarih araligindaki toplam gun sayisi
+                start = datetime.strptime(json_params['baslangicTarih'], '%d-%m-%Y')
+                end = datetime.strptime(json_params['bitisTarihi'], '%d-%m-%Y')
             except ValueError:
                 print(f"Valid format of the date is dd-mm-yyyy.\nControl start date({json_params['baslangicTarih']}) and end date({json_params['bitisTarihi']})")
                 return None
-            json_params['bitisTarihi'] = date_info[0]
-            # Baslangic tarihi denenir, sonuc alinamazsa ileri dogru gidilir.
-            for _ in range(day_obj):
-                response = self.make_request(method="POST", url=self.API_URL_YABANCI_ORANI, json_payload=json_params)
-                if response:
-                    df_dict['baslangicTarih'] = json_params['baslangicTarih']
-                    break
-                else:
-                    json_params['baslangicTarih'] = self.__date_edit(current_date=json_params['baslangicTarih'], increment_factor=1)
-                    json_params['bitisTarihi'] = self.__date_edit(current_date=json_params['bitisTarihi'], increment_factor=1)
 
-            # Bitis tarihi denenir, sonuc alinamazsa geriye dogru gidilir.
-            json_params['bitisTarihi'] = date_info[1]
-            for _ in range(day_obj):
-                response = self.make_request(method="POST", url=self.API_URL_YABANCI_ORANI, json_payload=json_params)
+            def request_range(range_start, range_end):
+                payload = dict(json_params, baslangicTarih=range_start.strftime('%d-%m-%Y'), bitisTarihi=range_end.strftime('%d-%m-%Y'))
+                return self.make_request(method="POST", url=self.API_URL_YABANCI_ORANI, json_payload=payload)
+
+            # 1. Tarihler, fiyat verisindeki en yakin islem gunlerine cekilir ve tek bir istek atilir.
+            snapped = self.__snap_to_trading_days(ticker=ticker, start=start, end=end)
+            if snapped is not None and snapped != (start, end):
+                response = request_range(*snapped)
                 if response:
-                    df_dict['bitisTarihi'] = json_params['bitisTarihi']
-                    break
-                else:
-                    json_params['bitisTarihi'] = self.__date_edit(current_date=json_params['bitisTarihi'], increment_factor=-1)
+                    start, end = snapped
 
-            if len(df_dict.keys()) == 0:
-                print(f"Istenilen tarih araliginda data bulunamadi. Tarihleri ({start_date} ve {end_date}) dogru sirada ve dogru formatta girdiginden emin ol.\nAyrica hisse kodunu ({ticker}) da kontrol et.")
-                return None
-        
-            json_params['baslangicTarih'] = df_dict['baslangicTarih']
-            json_params['bitisTarihi'] = df_dict['bitisTarihi']
-            # Makes a new request if dates are absolutely correct.
-            response = self.make_request(method="POST", url=self.API_URL_YABANCI_ORANI, json_payload=json_params)
+            # 2. Sonuc alinamazsa tarihler eszamanli ve giderek genisleyen gruplar halinde denenir.
+            if not response:
+                day_obj = (end - start).days # Istenen tarih araligindaki toplam gun sayisi
+                # Baslangic tarihi denenir, sonuc alinamazsa ileri dogru gidilir.
+                forward = [start + timedelta(days=i) for i in range(day_obj)]
+                found_start, _ = self.__probe_in_brackets(forward, lambda day: request_range(day, day))
+                # Hicbir gun sonuc vermediyse (bilinmeyen hisse vb.) aralikta veri yoktur; geriye dogru denemeye gerek kalmaz.
+                found_end = None
+                if found_start is not None:
+                    # Bitis tarihi denenir, sonuc alinamazsa geriye dogru gidilir.
+                    backward = [end - timedelta(days=i) for i in range(day_obj)]
+                    found_end, _ = self.__probe_in_brackets(backward, lambda day: request_range(found_start, day))
+
+                if found_start is None and found_end is None:
+                    print(f"Istenilen tarih araliginda data bulunamadi. Tarihleri ({start_date} ve {end_date}) dogru sirada ve dogru formatta girdiginden emin ol.\nAyrica hisse kodunu ({ticker}) da kontrol et.")
+                    return None
+                start, end = found_start or start, found_end or end
+                # Makes a new request if dates are absolutely correct.
+                response = request_range(start, end)
+
+            json_params['baslangicTarih'] = start.strftime('%d-%m-%Y')
+            json_params['bitisTarihi'] = end.strftime('%d-%m-%Y')
 
         df = pd.DataFrame(response)    
         column_mapping = {
@@ -470,7 +915,7 @@ class IsYatirimScraper(object):
         df['HISSE ISMI'] = df['HISSE ISMI'].str.strip()
         return df
 
-    def get_precious_metals_data(self, parameters:list, start_date:str, end_date:str, rep_type="historical"):
+    def get_precious_metals_data(self, parameters:list, start_date:str, end_date:str, rep_type="historical", join="inner"):
         """
         Gets precious metal data for the specified time range.
         Belirtilen zaman aralığı için değerli metal verilerini alır.
@@ -486,6 +931,7 @@ class IsYatirimScraper(object):
             start_date (str): Beginning date for the data. Valid format is 'dd-mm-YYYY' in str format.
             end_date (str): End date for the data. Valid format is 'dd-mm-YYYY' in str format.
             rep_type (str, optional): Type of data to retrieve, either "historical" or "daily". Defaults to "historical".
+            join (str, optional): How historical series are aligned on TARIH; "inner" keeps common dates, "outer" keeps all dates. Defaults to "inner".
 
         Returns:
             pandas.DataFrame: A DataFrame containing historical/daily price information of precious metals.
@@ -494,6 +940,12 @@ class IsYatirimScraper(object):
         if rep_type not in ["historical", "daily"]:
             print(f"Hatali parametre girisi. {rep_type} degerini kontrol ediniz.")
             return None
+        if join not in ["inner", "outer"]:
+            print(f"Hatali parametre girisi. {join} degerini kontrol ediniz.")
+            return None
+        if not parameters:
+            print("Hatali parametre girisi. En az bir sembol giriniz.")
+            return None
         for param in parameters:
             if param not in ["XAU/USD", "BRENT", "XAG/USD", "XPD/USD", "XPT/USD"]:
                 print(f"Hatali parametre girisi. {parameters} degerini kontrol ediniz.")
@@ -513,25 +965,33 @@ class IsYatirimScraper(object):
             start_date = "".join(start_date.split("-")[::-1])
             end_date = "".join(end_date.split("-")[::-1])
             
-            for param in parameters:
+            def fetch(param):
                 params = {
                     "period":1440, #60:saatlik, 180:3 saatlik, 360:6 saatlik, 60*24:1440; gunluk ...
                     "endeks":param,
                     "from":f"{start_date}000000",
                     "to":f"{end_date}235959"
                 }
-                
-                data = self.make_request(method="GET", url=self.API_URL_DEGERLI_METALLER_VE_EMTIA["historical"], params=params)
+                return self.make_request(method="GET", url=self.API_URL_DEGERLI_METALLER_VE_EMTIA["historical"], params=params)
+
+            # Metaller eszamanli istenir; executor.map sonuclari parametre sirasinda geri verir.
+            with ThreadPoolExecutor(max_workers=len(parameters)) as executor:
+                responses = list(executor.map(fetch, parameters))
+
+            for param, data in zip(parameters, responses):
                 if data:
                     column_name = param_details[param]
                     df = pd.DataFrame(data, columns=["TARIH", column_name])
-                    df["TARIH"] = df["TARIH"].apply(lambda unix_time_obj: datetime.fromtimestamp(unix_time_obj/1000.0).date())
-                    dfs.append(df)
-                    
-            merged_df = dfs[0] # herhangi bir df baz alinarak yan yana merger edilir
-            for df in dfs[1:]:
-                merged_df = pd.merge(merged_df, df, on="TARIH")
-            return merged_df
+                    # Unix zaman damgalari (ms) tek seferde Istanbul saatine gore tarihe cevrilir.
+                    df["TARIH"] = pd.to_datetime(df["TARIH"], unit="ms", utc=True).dt.tz_convert("Europe/Istanbul").dt.date
+                    dfs.append(df.drop_duplicates(subset="TARIH", keep="last").set_index("TARIH"))
+
+            if not dfs:
+                print(f"Istenilen tarih araliginda data bulunamadi. {parameters} ve tarihleri kontrol ediniz.")
+                return None
+            # Tum seriler tek bir indeks hizali concat ile birlestirilir.
+            merged_df = pd.concat(dfs, axis=1, join=join).sort_index()
+            return merged_df.rename_axis("TARIH").reset_index()
         
         # returns daily changes of requested metals
         elif rep_type == "daily":
@@ -557,3 +1017,224 @@ class IsYatirimScraper(object):
             df["EMTIA ISMI (TR)"] = df["EMTIA KODU"].map(param_details)
             desired_order = ['EMTIA KODU', 'EMTIA ISMI (EN)', "EMTIA ISMI (TR)", 'ONCEKI KAPANIS ($)','SON DEGER ($)', 'GUNLUK DEGISIM ($)','GUNLUK DEGISIM (%)',]
             return df[desired_order] # ya da -> .reindex(columns=desired_order) 
+
+    def get_daily_quotes(self, parameters:list) -> dict:
+        """
+        Retrieves the current OneEndeks quote of every symbol as a lightweight record, bypassing the response cache.
+        Verilen sembollerin anlık OneEndeks verilerini önbelleği atlayarak, DataFrame oluşturmadan hafif kayıtlar olarak alır.
+
+        Args:
+            parameters (list): Symbols such as "XAU/USD", see get_precious_metals_data().
+
+        Returns:
+            dict: Symbol -> record with the EMTIA KODU, ONCEKI KAPANIS ($), SON DEGER ($), GUNLUK DEGISIM ($) and
+                GUNLUK DEGISIM (%) fields. Symbols that could not be fetched are left out.
+        """
+        fetch = lambda param: self.make_request(method="GET", url=self.API_URL_DEGERLI_METALLER_VE_EMTIA["daily"], params={"endeks": param}, ttl=0)
+        # Semboller eszamanli istenir.
+        with ThreadPoolExecutor(max_workers=max(len(parameters), 1)) as executor:
+            responses = list(executor.map(fetch, parameters))
+        quotes = {}
+        for data in responses:
+            for item in data or []:
+                quotes[item["c"]] = {
+                    "EMTIA KODU": item["c"],
+                    "ONCEKI KAPANIS ($)": item.get("previousDayClose"),
+                    "SON DEGER ($)": item.get("last"),
+                    "GUNLUK DEGISIM ($)": item.get("dailyChange"),
+                    "GUNLUK DEGISIM (%)": item.get("dailyChangePercentage"),
+                }
+        return quotes
+
+    @staticmethod
+    def changed_quotes(previous:dict, current:dict) -> list:
+        """
+        İki anlık görüntü arasında değişen (ya da yeni gelen) sembollerin kayıtlarını geri verir.
+        Returns the records of the symbols that changed (or appeared) between two get_daily_quotes() snapshots.
+        """
+        return [record for symbol, record in current.items() if previous.get(symbol) != record]
+
+    def subscribe_daily_quotes(self, parameters:list, callback, interval=5.0, stop_event=None, max_polls=None) -> None:
+        """
+        Polls OneEndeks at a fixed interval and calls the callback with the records of the symbols that changed since the previous poll.
+        OneEndeks'i belirli aralıklarla sorgular ve yalnızca bir önceki sorgudan bu yana değişen sembolleri callback'e iletir.
+
+        The call blocks; run it in a thread and set stop_event to stop it. The first poll reports every symbol.
+
+        Args:
+            parameters (list): Symbols such as "XAU/USD", see get_precious_metals_data().
+            callback (callable): Called with a list of changed records, see get_daily_quotes().
+            interval (float, optional): Seconds between two polls. Defaults to 5.0.
+            stop_event (threading.Event, optional): Stops the subscription when set. Defaults to None.
+            max_polls (int, optional): Stops after this many polls. Defaults to None (runs until stop_event is set).
+        """
+        snapshot, polls = {}, 0
+        while stop_event is None or not stop_event.is_set():
+            started = time.monotonic()
+            current = self.get_daily_quotes(parameters)
+            changed = self.changed_quotes(snapshot, current)
+            snapshot.update(current)
+            if changed:
+                callback(changed)
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                return
+            # Sorgu suresi bekleme suresinden dusulur.
+            wait = max(0.0, interval - (time.monotonic() - started))
+            if stop_event is not None:
+                stop_event.wait(wait)
+            else:
+                time.sleep(wait)
+
+
+class AsyncIsYatirimScraper(object):
+    """
+    IsYatirimScraper sınıfının asyncio karşılığı. Tüm get_* metotları coroutine olarak sunulur.
+    An asyncio counterpart of IsYatirimScraper exposing every get_* method as a coroutine.
+
+    Her çağrı, aynı havuzlanmış oturumu kullanan bir IsYatirimScraper üzerinde iş parçacığı havuzunda çalıştırılır;
+    böylece veri işleme yardımcıları (__process_is_yatirim_price_data, __process_financial_data vb.) değiştirilmeden kullanılır.
+    Semafor aynı anda çalışan metot çağrısı sayısını sınırlar. Bazı metotlar (get_price_panel, pencereli fiyat indirme vb.)
+    kendi iş parçacığı havuzlarını açtığı için ağdaki istek sayısı ayrıca HttpClient(max_in_flight=max_concurrency) ile
+    sınırlandırılır. Dışarıdan http_client verilirse bu sınır o istemcinin max_in_flight değeridir.
+
+    Attributes:
+        max_concurrency (int): Maximum number of concurrent method calls, and of HTTP requests in flight on the default client.
+        scraper (IsYatirimScraper): The synchronous scraper the coroutines delegate to.
+
+    Methods:
+        get_is_yatirim_price_data(ticker, start_date, end_date, compact, window_days):
+            Coroutine version of IsYatirimScraper.get_is_yatirim_price_data.
+        get_price_panel(tickers, start_date, end_date, workers, pivot, compact):
+            Coroutine version of IsYatirimScraper.get_price_panel.
+        get_is_yatirim_financial_statements(ticker, current_year):
+            Coroutine version of IsYatirimScraper.get_is_yatirim_financial_statements.
+        get_is_yatirim_financial_data(ticker, current_year, cumulative):
+            Coroutine version of IsYatirimScraper.get_is_yatirim_financial_data.
+        get_capital_gain_data(ticker, year):
+            Coroutine version of IsYatirimScraper.get_capital_gain_data.
+        get_capital_gain_table(endeks, sektor, refresh_days):
+            Coroutine version of IsYatirimScraper.get_capital_gain_table.
+        get_dividend_data(ticker):
+            Coroutine version of IsYatirimScraper.get_dividend_data.
+        get_foreign_exchange_rate(ticker, start_date, end_date):
+            Coroutine version of IsYatirimScraper.get_foreign_exchange_rate.
+        get_precious_metals_data(parameters, start_date, end_date, rep_type, join):
+            Coroutine version of IsYatirimScraper.get_precious_metals_data.
+        get_daily_quotes(parameters):
+            Coroutine version of IsYatirimScraper.get_daily_quotes.
+        watch_daily_quotes(parameters, interval):
+            Async generator yielding the OneEndeks quotes that changed since the previous poll.
+        close():
+            Shuts down the worker threads.
+    """
+
+    def __init__(self, max_concurrency=16, http_client=None) -> None:
+        self.max_concurrency = max_concurrency
+        if http_client is None:
+            # Havuzdaki baglanti sayisi eszamanli istek sayisindan az olmamali; agdaki istek sayisi da ayni sinirla tutulur.
+            shared = HttpClient.shared()
+            http_client = HttpClient(pool_maxsize=max(max_concurrency, 1), cache=shared.cache, rate_limiter=shared.rate_limiter, max_in_flight=max_concurrency)
+        self.scraper = IsYatirimScraper(http_client=http_client)
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+        self.__executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="isyatirim")
+
+    async def __run(self, func, *args, **kwargs):
+        """
+        Verilen senkron metodu semafor altında bir iş parçacığında çalıştırır.
+        Runs the given blocking method in a worker thread while holding the semaphore.
+        """
+        async with self.__semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.__executor, partial(func, *args, **kwargs))
+
+    async def get_is_yatirim_price_data(self, ticker:str, start_date:str, end_date:str, compact=False, window_days=365):
+        """
+        Retrieves historical price data of a given company. See IsYatirimScraper.get_is_yatirim_price_data.
+        """
+        return await self.__run(self.scraper.get_is_yatirim_price_data, ticker=ticker, start_date=start_date, end_date=end_date, compact=compact, window_days=window_days)
+
+    async def get_price_panel(self, tickers:list, start_date:str, end_date:str, workers=8, pivot=None, compact=False):
+        """
+        Retrieves historical price data of many companies as a single panel. See IsYatirimScraper.get_price_panel.
+        """
+        return await self.__run(self.scraper.get_price_panel, tickers=tickers, start_date=start_date, end_date=end_date, workers=workers, pivot=pivot, compact=compact)
+
+    async def get_is_yatirim_financial_statements(self, ticker:str, current_year:int):
+        """
+        Retrieves the cumulative and the quarterly financial statements at once. See IsYatirimScraper.get_is_yatirim_financial_statements.
+        """
+        return await self.__run(self.scraper.get_is_yatirim_financial_statements, ticker=ticker, current_year=current_year)
+
+    async def get_is_yatirim_financial_data(self, ticker:str, current_year:int, cumulative=True):
+        """
+        Retrieves financial data of a given company. See IsYatirimScraper.get_is_yatirim_financial_data.
+        """
+        return await self.__run(self.scraper.get_is_yatirim_financial_data, ticker=ticker, current_year=current_year, cumulative=cumulative)
+
+    async def get_capital_gain_data(self, ticker:str, year=0):
+        """
+        Retrieves capital gain data of a given company. See IsYatirimScraper.get_capital_gain_data.
+        """
+        return await self.__run(self.scraper.get_capital_gain_data, ticker=ticker, year=year)
+
+    async def get_capital_gain_table(self, endeks="09", sektor="", refresh_days=1):
+        """
+        Retrieves capital gain data of every company in an index/sector. See IsYatirimScraper.get_capital_gain_table.
+        """
+        return await self.__run(self.scraper.get_capital_gain_table, endeks=endeks, sektor=sektor, refresh_days=refresh_days)
+
+    async def get_dividend_data(self, ticker:str):
+        """
+        Retrieves dividend data of a given company. See IsYatirimScraper.get_dividend_data.
+        """
+        return await self.__run(self.scraper.get_dividend_data, ticker=ticker)
+
+    async def get_foreign_exchange_rate(self, ticker:str, start_date, end_date):
+        """
+        Retrieves foreign exchange rate of a given company. See IsYatirimScraper.get_foreign_exchange_rate.
+        """
+        return await self.__run(self.scraper.get_foreign_exchange_rate, ticker=ticker, start_date=start_date, end_date=end_date)
+
+    async def get_precious_metals_data(self, parameters:list, start_date:str, end_date:str, rep_type="historical", join="inner"):
+        """
+        Retrieves precious metals data. See IsYatirimScraper.get_precious_metals_data.
+        """
+        return await self.__run(self.scraper.get_precious_metals_data, parameters=parameters, start_date=start_date, end_date=end_date, rep_type=rep_type, join=join)
+
+    async def get_daily_quotes(self, parameters:list):
+        """
+        Retrieves the current OneEndeks quote of every symbol. See IsYatirimScraper.get_daily_quotes.
+        """
+        return await self.__run(self.scraper.get_daily_quotes, parameters=parameters)
+
+    async def watch_daily_quotes(self, parameters:list, interval=5.0):
+        """
+        OneEndeks'i belirli aralıklarla sorgulayan ve yalnızca değişen sembolleri üreten bir async generator.
+        Async generator that polls OneEndeks at a fixed interval and yields the records of the symbols that changed since the previous poll.
+        See IsYatirimScraper.subscribe_daily_quotes for the callback variant.
+
+        Args:
+            parameters (list): Symbols such as "XAU/USD".
+            interval (float, optional): Seconds between two polls. Defaults to 5.0.
+
+        Yields:
+            list: Records of the changed symbols; the first poll yields every symbol.
+        """
+        loop = asyncio.get_running_loop()
+        snapshot = {}
+        while True:
+            started = loop.time()
+            current = await self.get_daily_quotes(parameters=parameters)
+            changed = self.scraper.changed_quotes(snapshot, current)
+            snapshot.update(current)
+            if changed:
+                yield changed
+            await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
+
+    def close(self):
+        """
+        İş parçacığı havuzunu kapatır.
+        Shuts down the worker threads.
+        """
+        self.__executor.shutdown(wait=True)
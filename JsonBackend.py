@@ -0,0 +1,132 @@
+import threading
+
+class JsonBackend(object):
+    """
+    Tüm scraper'ların kullandığı, değiştirilebilir (pluggable) JSON çözücü.
+    A pluggable JSON decoder shared by every scraper.
+
+    Kuruluysa orjson, değilse ujson, o da yoksa standart kütüphanedeki json kullanılır. isyatirim.com.tr yanıtlarındaki
+    "d"/"value"/"data" zarfları ve "d" içinde metin olarak gönderilen ikinci JSON katmanı yalnızca burada açılır.
+    Tüm çözücülerin hata tipleri ValueError'dan türediği için hatalar tek bir tip ile yakalanabilir.
+
+    Attributes:
+        name (str): Name of the backend in use ("orjson", "ujson" or "json").
+
+    Methods:
+        available():
+            Returns the names of the installed backends in order of preference.
+        shared():
+            Returns the process-wide backend, creating it on first use.
+        use(name):
+            Replaces the process-wide backend.
+        loads(content):
+            Decodes a JSON document given as str or bytes.
+        unwrap(data):
+            Opens the "value"/"d"/"data" envelope of an isyatirim.com.tr response.
+        decode(content):
+            Decodes a response body and opens its envelope.
+    """
+
+    PREFERRED = ["orjson", "ujson", "json"]
+
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, name=None) -> None:
+        available = self.available()
+        if name is None:
+            name = available[0]
+        elif name not in available:
+            raise ValueError(f"JSON cozucu bulunamadi: {name}. Kurulu olanlar: {available}")
+        self.name = name
+        self.__module = __import__(name)
+
+    @classmethod
+    def available(cls) -> list:
+        """
+        Kurulu JSON çözücülerini tercih sırasına göre geri verir.
+        Returns the names of the installed backends in order of preference.
+        """
+        names = []
+        for name in cls.PREFERRED:
+            try:
+                __import__(name)
+            except ImportError:
+                continue
+            names.append(name)
+        return names
+
+    @classmethod
+    def shared(cls):
+        """
+        Süreç genelinde paylaşılan çözücüyü geri verir; ilk çağrıda kurulu en hızlı çözücü ile oluşturur.
+        Returns the process-wide backend, creating it with the fastest installed decoder on first use.
+
+        Returns:
+            JsonBackend: The shared backend.
+        """
+        if cls._shared_instance is None:
+            with cls._shared_lock:
+                if cls._shared_instance is None:
+                    cls._shared_instance = cls()
+        return cls._shared_instance
+
+    @classmethod
+    def use(cls, name:str):
+        """
+        Süreç genelinde kullanılan çözücüyü değiştirir.
+        Replaces the process-wide backend, e.g. JsonBackend.use("json") to compare against the standard library.
+
+        Args:
+            name (str): "orjson", "ujson" or "json".
+
+        Returns:
+            JsonBackend: The new shared backend.
+        """
+        with cls._shared_lock:
+            cls._shared_instance = cls(name)
+        return cls._shared_instance
+
+    def loads(self, content):
+        """
+        str veya bytes olarak verilen bir JSON belgesini çözer.
+        Decodes a JSON document given as str or bytes.
+
+        Raises:
+            ValueError: If the content is not valid JSON.
+        """
+        return self.__module.loads(content)
+
+    def unwrap(self, data):
+        """
+        isyatirim.com.tr yanıtlarındaki "value"/"d"/"data" zarfını açar; "d" metin ise ikinci kez çözülür.
+        Opens the "value"/"d"/"data" envelope of an isyatirim.com.tr response; a string "d" is decoded once more.
+
+        Args:
+            data: The decoded response.
+
+        Returns:
+            The payload inside the envelope, or the data itself if there is no envelope.
+        """
+        if not isinstance(data, dict):
+            return data
+        if "value" in data:
+            return data["value"]
+        if "d" in data:
+            return self.loads(data["d"]) if isinstance(data["d"], str) else data["d"]
+        if "data" in data:
+            return data["data"]
+        return data
+
+    def decode(self, content):
+        """
+        Yanıt gövdesini çözer ve zarfını açar.
+        Decodes a response body and opens its envelope.
+
+        Args:
+            content (str | bytes): The response body.
+
+        Returns:
+            The decoded payload.
+        """
+        return self.unwrap(self.loads(content))
@@ -1,10 +1,10 @@
-from urllib.request import urlopen, Request
 from datetime import date, timedelta
 from bs4 import BeautifulSoup
+from HttpClient import HttpClient
+from JsonBackend import JsonBackend
 import pickle 
 import random 
 import time
-import json
 import sys 
 import csv 
 import io
@@ -76,14 +76,14 @@ class KAPHelper:
         """
         timestamp = int(time.time())
         headers = {"User-Agent":f"{random.choice(KAPHelper.user_agents)} {timestamp}"}
-        safe_url = Request(url, headers=headers, method=method)
 
         try:
-            with urlopen(safe_url) as response:
-                if response.status == 200:
-                    return response.read()
-                else:
-                    raise Exception(f"İşlem {response.status} kodu ile sonlandırıldı.")
+            # Surec genelinde paylasilan oturum ve yanit onbellegi kullanilir.
+            response = HttpClient.shared().request(method, url, headers=headers)
+            if response.status_code == 200:
+                return response.content
+            else:
+                raise Exception(f"İşlem {response.status_code} kodu ile sonlandırıldı.")
         except Exception as e:
             print(f"Sayfa bilgileri alınamadı. Hata: {e}")
             return None
@@ -217,7 +217,7 @@ class KAPHelper:
             url = f"https://www.kap.org.tr/tr/api/disclosures?ts={su_an}&disclosureTypes={bildirim_tipi}&fromDate={x_gun_oncesi}&toDate={bugun}&memberTypes={sirket_tipi}"
 
         response = KAPHelper.make_request(url=url)
-        json_data = json.loads(response)
+        json_data = JsonBackend.shared().loads(response)
         data_list = []
         tags_to_keep = ["disclosureIndex", "companyName", "stockCodes", "title", "publishDate", "disclosureType"]
         # Mapping of old keys to new keys
@@ -261,7 +261,7 @@ class KAPHelper:
         print("VERILER CEKILIYOR...")
         with open("firma_id_pickle", "ab") as file:
             for firma, kap_linki in firma_listesi.items():
-                time.sleep(3)
+                # Istek hizi HttpClient'in kap.org.tr icin tanimli hiz sinirlayicisi ile ayarlanir.
                 try:
                     firma_id = KAPHelper.parser(url=kap_linki).select("a.w-inline-block.tab-subpage2")[0].get("ng-click")
                     if len(firma_id) == 0:
@@ -544,7 +544,7 @@ class KAP:
         firma_kap_id = self._firma_kap_id()
         url = f"https://www.kap.org.tr/tr/FilterSgbf/FILTERSGBF/{firma_kap_id}/{bildirim_tipi}/{zaman_araligi}"
         response = self.kap_helper.make_request(url=url)
-        json_data = json.loads(response)
+        json_data = JsonBackend.shared().loads(response)
         data_list = []
         tags_to_keep = ["disclosureIndex", "companyName", "stockCodes", "title", "publishDate", "disclosureType"]
         # Mapping of old keys to new keys
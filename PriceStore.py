@@ -0,0 +1,213 @@
+import threading
+import pandas as pd
+from datetime import date
+from DateRange import to_date, missing_ranges, extend_coverage
+from SqliteConnection import connect
+from CacheDir import cache_path
+
+class PriceStore(object):
+    """
+    HisseTekil fiyat verileri için diskte tutulan, artımlı (incremental) bir fiyat deposu.
+    An incremental on-disk (SQLite) store for HisseTekil price data.
+
+    Her hisse için depoda bulunan tarih aralığı (kapsam) kaydedilir; yalnızca eksik kalan baş ve son aralıklar API'den istenir.
+    Yeni satırlar ve güncellenen kapsam tek bir işlem (transaction) içinde, atomik olarak yazılır.
+    Bugüne ait fiyatlar gün içinde değişebileceği için kapsama dahil edilmez ve her seferinde yeniden istenir.
+    Endeks/sektör bazında indirilen sermaye artırımı (bölünme, bedelli/bedelsiz) tabloları da aynı veritabanında tutulur.
+
+    Attributes:
+        path (str): Path of the SQLite database file; fiyat_verileri.sqlite3 in the cache directory (see CacheDir) by default.
+
+    Methods:
+        coverage(ticker):
+            Returns the (start, end) dates stored for the ticker, or None.
+        missing_ranges(ticker, start_date, end_date):
+            Returns the date ranges that are not stored yet.
+        write(ticker, df, start_date, end_date):
+            Atomically appends the rows and extends the stored coverage.
+        read(ticker, start_date, end_date):
+            Returns the stored rows in the requested range as a processed price DataFrame.
+        capital_gains_updated(universe):
+            Returns the date the capital increase table of a universe was last refreshed.
+        write_capital_gains(universe, data, years):
+            Atomically replaces the stored capital increase rows of a universe, for all or only the given years.
+        read_capital_gains(universe):
+            Returns the stored capital increase rows of a universe in the API's raw format.
+    """
+
+    # DataFrame sutunlari ve veritabani sutunlari
+    COLUMNS = {
+        "GUN ICI EN DUSUK": "en_dusuk",
+        "GUN ICI EN YUKSEK": "en_yuksek",
+        "KAPANIS FIYATI (TL)": "kapanis",
+        "ENDEKS DEGERI (BIST100)": "endeks",
+        "ENDEKS BAZLI FIYAT": "endeks_bazli",
+        "DOLAR KURU (TL)": "dolar",
+        "DOLAR BAZLI FIYAT (USD)": "dolar_bazli",
+        "HACIM (TL)": "hacim",
+    }
+
+    # GetSermayeArttirimlari yanitindaki sayisal sutunlar
+    CAPITAL_GAIN_COLUMNS = ["HSP_BOLUNME_SONRASI_SERMAYE", "SHHE_BDLI_ORAN", "SHHE_BDLI_NOM_TUTAR", "SHHE_RHK_ORAN", "SHHE_BDSZ_IK_ORAN", "SHHE_BDSZ_TM_ORAN"]
+
+    def __init__(self, path=None) -> None:
+        self.path = path if path is not None else cache_path("fiyat_verileri.sqlite3")
+        self.__lock = threading.Lock()
+        value_columns = ", ".join(f"{col} REAL" for col in self.COLUMNS.values())
+        with connect(self.path) as conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS fiyatlar (hisse TEXT NOT NULL, tarih TEXT NOT NULL, {value_columns}, PRIMARY KEY (hisse, tarih))")
+            conn.execute("CREATE TABLE IF NOT EXISTS kapsam (hisse TEXT PRIMARY KEY, baslangic TEXT NOT NULL, bitis TEXT NOT NULL)")
+            capital_gain_columns = ", ".join(f"{col} REAL" for col in self.CAPITAL_GAIN_COLUMNS)
+            conn.execute(f"CREATE TABLE IF NOT EXISTS sermaye_artirimlari (evren TEXT NOT NULL, SHHE_HS_KODU TEXT NOT NULL, SHHE_TARIH INTEGER, {capital_gain_columns})")
+            conn.execute("CREATE INDEX IF NOT EXISTS sermaye_artirimlari_evren ON sermaye_artirimlari (evren, SHHE_HS_KODU)")
+            conn.execute("CREATE TABLE IF NOT EXISTS sermaye_guncelleme (evren TEXT PRIMARY KEY, tarih TEXT NOT NULL)")
+
+    def coverage(self, ticker:str):
+        """
+        Depoda ilgili hisse için bulunan tarih aralığını geri verir.
+        Returns the (start, end) dates stored for the ticker, or None if nothing is stored.
+
+        Args:
+            ticker (str): The stock code of the company.
+
+        Returns:
+            tuple | None: (start, end) as date objects.
+        """
+        with connect(self.path) as conn:
+            row = conn.execute("SELECT baslangic, bitis FROM kapsam WHERE hisse = ?", (ticker,)).fetchone()
+        if row is None:
+            return None
+        return date.fromisoformat(row[0]), date.fromisoformat(row[1])
+
+    def missing_ranges(self, ticker:str, start_date, end_date) -> list:
+        """
+        İstenen aralıkta depoda bulunmayan baş ve son tarih aralıklarını geri verir.
+        Returns the head/tail date ranges of the request that are not stored yet.
+
+        Args:
+            ticker (str): The stock code of the company.
+            start_date (str | date): Start of the requested range. String format is dd-mm-YYYY.
+            end_date (str | date): End of the requested range. String format is dd-mm-YYYY.
+
+        Returns:
+            list: A list of (start, end) date tuples to be downloaded.
+        """
+        return missing_ranges(self.coverage(ticker), start_date, end_date)
+
+    def write(self, ticker:str, df:pd.DataFrame, start_date, end_date) -> None:
+        """
+        Verilen fiyatları depoya ekler ve kapsamı genişletir. İkisi tek bir işlem içinde yapılır.
+        Atomically appends the rows and extends the stored coverage with the downloaded range.
+
+        Args:
+            ticker (str): The stock code of the company.
+            df (pd.DataFrame): Processed price data as returned by get_is_yatirim_price_data().
+            start_date (str | date): Start of the downloaded range.
+            end_date (str | date): End of the downloaded range.
+        """
+        rows = []
+        if df is not None and not df.empty:
+            # SQLite NaN degerlerini NULL olarak saklar.
+            values = df[list(self.COLUMNS.keys())].astype(float).itertuples(index=False, name=None)
+            tarihler = pd.to_datetime(df["TARIH"]).dt.strftime("%Y-%m-%d")
+            rows = [(ticker, tarih, *value) for tarih, value in zip(tarihler, values)]
+
+        placeholders = ", ".join("?" for _ in range(len(self.COLUMNS) + 2))
+        with self.__lock, connect(self.path) as conn:
+            conn.executemany(f"INSERT OR REPLACE INTO fiyatlar VALUES ({placeholders})", rows)
+            row = conn.execute("SELECT baslangic, bitis FROM kapsam WHERE hisse = ?", (ticker,)).fetchone()
+            covered = (date.fromisoformat(row[0]), date.fromisoformat(row[1])) if row is not None else None
+            extended = extend_coverage(covered, start_date, end_date)
+            if extended != covered:
+                conn.execute("INSERT OR REPLACE INTO kapsam VALUES (?, ?, ?)", (ticker, extended[0].isoformat(), extended[1].isoformat()))
+
+    def read(self, ticker:str, start_date, end_date) -> pd.DataFrame:
+        """
+        Depodaki fiyatları istenen aralık için okur.
+        Returns the stored rows in the requested range, in the same format as get_is_yatirim_price_data().
+
+        Args:
+            ticker (str): The stock code of the company.
+            start_date (str | date): Start of the requested range.
+            end_date (str | date): End of the requested range.
+
+        Returns:
+            pd.DataFrame: A pandas DataFrame containing historical price data.
+        """
+        start, end = to_date(start_date), to_date(end_date)
+        columns = ", ".join(self.COLUMNS.values())
+        with connect(self.path) as conn:
+            df = pd.read_sql_query(
+                f"SELECT tarih, hisse, {columns} FROM fiyatlar WHERE hisse = ? AND tarih BETWEEN ? AND ? ORDER BY tarih",
+                conn,
+                params=(ticker, start.isoformat(), end.isoformat()),
+            )
+        df.columns = ["TARIH", "HISSE KODU"] + list(self.COLUMNS.keys())
+        df[list(self.COLUMNS.keys())] = df[list(self.COLUMNS.keys())].astype(float)
+        df["TARIH"] = pd.to_datetime(df["TARIH"], format="%Y-%m-%d")
+        return df
+
+    def capital_gains_updated(self, universe:str):
+        """
+        Verilen evrene (endeks/sektör) ait sermaye artırımı tablosunun en son güncellendiği tarihi geri verir.
+        Returns the date the capital increase table of a universe was last refreshed, or None.
+
+        Args:
+            universe (str): Key of the index/sector the table belongs to.
+
+        Returns:
+            date | None: Date of the last refresh.
+        """
+        with connect(self.path) as conn:
+            row = conn.execute("SELECT tarih FROM sermaye_guncelleme WHERE evren = ?", (universe,)).fetchone()
+        return date.fromisoformat(row[0]) if row is not None else None
+
+    def write_capital_gains(self, universe:str, data:list, years=None) -> None:
+        """
+        Evrene ait sermaye artırımı kayıtlarını tek bir işlem içinde yeniler. years verilirse yalnızca o yıllar
+        ve henüz tarihi açıklanmamış kayıtlar değiştirilir. Birden fazla yanıtta gelen aynı kayıt bir kez saklanır.
+        Atomically replaces the capital increase rows of a universe. If years is given, only rows of those years
+        and rows whose date is not announced yet are replaced. A record that comes in more than one response is stored once.
+
+        Args:
+            universe (str): Key of the index/sector the table belongs to.
+            data (list): Raw GetSermayeArttirimlari records.
+            years (list, optional): Years that were downloaded. Defaults to None (all years).
+        """
+        columns = ["SHHE_HS_KODU", "SHHE_TARIH"] + self.CAPITAL_GAIN_COLUMNS
+        rows = [(universe, *(record.get(col) for col in columns)) for record in data]
+        placeholders = ", ".join("?" for _ in range(len(columns) + 1))
+        with self.__lock, connect(self.path) as conn:
+            if years is None:
+                conn.execute("DELETE FROM sermaye_artirimlari WHERE evren = ?", (universe,))
+            else:
+                # Yil, API'nin kayitlari yillara ayirdigi gibi Istanbul saatine gore hesaplanir; SQLite'in UTC yili
+                # 1 Ocak'taki kayitlari onceki yila sayar. Negatif zaman damgalari (aciklanmadi) her yenilemede tekrar indirilir.
+                stored = pd.read_sql_query("SELECT rowid, SHHE_TARIH FROM sermaye_artirimlari WHERE evren = ?", conn, params=(universe,))
+                timestamps = pd.to_numeric(stored["SHHE_TARIH"])
+                stored_years = pd.to_datetime(timestamps.where(timestamps >= 0), unit="ms", utc=True).dt.tz_convert("Europe/Istanbul").dt.year
+                stale = stored.loc[(timestamps < 0) | stored_years.isin(years), "rowid"]
+                conn.executemany("DELETE FROM sermaye_artirimlari WHERE rowid = ?", [(int(rowid),) for rowid in stale])
+            conn.executemany(f"INSERT INTO sermaye_artirimlari (evren, {', '.join(columns)}) VALUES ({placeholders})", rows)
+            # Planlanan islemler yillik yanitlarda da gelebilir; ayni kayit yalnizca bir kez (en yenisi) tutulur.
+            conn.execute(
+                f"DELETE FROM sermaye_artirimlari WHERE evren = ? AND rowid NOT IN "
+                f"(SELECT MAX(rowid) FROM sermaye_artirimlari WHERE evren = ? GROUP BY {', '.join(columns)})",
+                (universe, universe),
+            )
+            conn.execute("INSERT OR REPLACE INTO sermaye_guncelleme VALUES (?, ?)", (universe, date.today().isoformat()))
+
+    def read_capital_gains(self, universe:str) -> pd.DataFrame:
+        """
+        Evrene ait sermaye artırımı kayıtlarını API'nin ham sütun isimleriyle geri verir.
+        Returns the stored capital increase rows of a universe with the API's raw column names.
+
+        Args:
+            universe (str): Key of the index/sector the table belongs to.
+
+        Returns:
+            pd.DataFrame: Raw capital increase records.
+        """
+        columns = ["SHHE_HS_KODU", "SHHE_TARIH"] + self.CAPITAL_GAIN_COLUMNS
+        with connect(self.path) as conn:
+            return pd.read_sql_query(f"SELECT {', '.join(columns)} FROM sermaye_artirimlari WHERE evren = ?", conn, params=(universe,))
@@ -60,16 +60,17 @@ class Review(object):
             Calculates and returns the net debt.
     """
 
-    def __init__(self, company_name, year) -> None:
+    def __init__(self, company_name, year, price_store=None) -> None:
         """
         Initializes the Review object.
 
         Args:
             company_name (str): The name or ticker symbol of the company.
             year (int): The year for which financial data is to be reviewed.
+            price_store (PriceStore, optional): On-disk price store used for the price history. Defaults to None.
         """
         self.company_name = company_name
-        self.is_yatirim_init = IsYatirimScraper() # initializes IsYatirimScraper
+        self.is_yatirim_init = IsYatirimScraper(price_store=price_store) # initializes IsYatirimScraper
         self.year = year
         self.financial_statement = self.__initializer()
         self.number_of_shares = self.__setter()["number_of_shares"]
@@ -88,8 +89,8 @@ class Review(object):
         (3) Cash Flow
         """
         is_yatirim = self.is_yatirim_init
-        fs_ann = is_yatirim.get_is_yatirim_financial_data(ticker=self.company_name, current_year=self.year, cumulative=True)
-        fs_qua = is_yatirim.get_is_yatirim_financial_data(ticker=self.company_name, current_year=self.year, cumulative=False)
+        # Tek indirme ile hem kumulatif hem de ceyreklik tablolar elde edilir.
+        fs_ann, fs_qua = is_yatirim.get_is_yatirim_financial_statements(ticker=self.company_name, current_year=self.year)
         fs_ann["ACIKLAMA"] = fs_ann["ACIKLAMA"].apply(lambda x:x.strip())
         fs_qua["ACIKLAMA"] = fs_qua["ACIKLAMA"].apply(lambda x:x.strip())
         return fs_ann, fs_qua # financial-statements as annually and quarterly
@@ -0,0 +1,103 @@
+import time
+import threading
+from urllib.parse import urlsplit
+
+class TokenBucket(object):
+    """
+    Thread-safe bir jeton kovası (token bucket). Saniyede `rate` jeton üretir, en fazla `capacity` jeton biriktirir.
+    A thread-safe token bucket that refills `rate` tokens per second up to `capacity`.
+
+    Attributes:
+        rate (float): Sustained requests per second.
+        capacity (float): Maximum burst size.
+
+    Methods:
+        acquire():
+            Blocks until a token is available and consumes it.
+    """
+
+    def __init__(self, rate:float, capacity:float=None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.__tokens = self.capacity
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Bir jeton alınabilene kadar bekler ve jetonu harcar.
+        Blocks until a token is available and consumes it.
+        """
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                self.__tokens = min(self.capacity, self.__tokens + (now - self.__updated) * self.rate)
+                self.__updated = now
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+                wait = (1 - self.__tokens) / self.rate
+            # Kilit disinda beklenir; diger is parcaciklari bu sirada kovayi kontrol edebilir.
+            time.sleep(wait)
+
+class RateLimiter(object):
+    """
+    Sunucu (host) başına jeton kovası tutan, tüm iş parçacıkları arasında paylaşılan istek hızı sınırlayıcı.
+    A per-host rate limiter that keeps one token bucket per host and is shared by every thread.
+
+    AsyncIsYatirimScraper coroutine'leri istekleri iş parçacıklarında çalıştırdığı için aynı sınırlayıcıya tabidir.
+
+    Attributes:
+        rates (dict): Host -> (requests per second, burst) pairs; the maximum sustainable throughput per host.
+        default_rate (tuple): (requests per second, burst) used for hosts that are not listed in rates.
+
+    Methods:
+        set_rate(host, rate, burst):
+            Changes the maximum sustainable throughput of a host.
+        acquire(url):
+            Blocks until a request to the host of the url is allowed.
+    """
+
+    DEFAULT_RATES = {
+        "www.isyatirim.com.tr": (8.0, 16),
+        "www.kap.org.tr": (1.0, 2),
+        "query1.finance.yahoo.com": (4.0, 8),
+    }
+
+    def __init__(self, rates=None, default_rate=(4.0, 8)) -> None:
+        self.rates = dict(self.DEFAULT_RATES if rates is None else rates)
+        self.default_rate = default_rate
+        self.__buckets = {}
+        self.__lock = threading.Lock()
+
+    def set_rate(self, host:str, rate:float, burst:float=None) -> None:
+        """
+        Bir sunucu için saniyedeki en yüksek istek sayısını değiştirir.
+        Changes the maximum sustainable throughput of a host.
+
+        Args:
+            host (str): The host name, e.g. "www.isyatirim.com.tr".
+            rate (float): Requests per second.
+            burst (float, optional): Maximum burst size. Defaults to max(1, rate).
+        """
+        with self.__lock:
+            self.rates[host] = (rate, burst)
+            self.__buckets.pop(host, None)
+
+    def __bucket(self, host:str) -> TokenBucket:
+        with self.__lock:
+            bucket = self.__buckets.get(host)
+            if bucket is None:
+                rate, burst = self.rates.get(host, self.default_rate)
+                bucket = self.__buckets[host] = TokenBucket(rate=rate, capacity=burst)
+            return bucket
+
+    def acquire(self, url:str) -> None:
+        """
+        URL'nin ait olduğu sunucuya istek atılmasına izin verilene kadar bekler.
+        Blocks until a request to the host of the url is allowed.
+
+        Args:
+            url (str): The URL of the request.
+        """
+        self.__bucket(urlsplit(url).netloc).acquire()
@@ -0,0 +1,217 @@
+import json
+import math
+import time
+import threading
+from datetime import date, datetime, timedelta
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from SqliteConnection import connect
+from CacheDir import cache_path
+
+class ResponseCache(object):
+    """
+    Tüm scraper'ların paylaşabileceği, diskte tutulan bir HTTP yanıt önbelleği.
+    A disk-backed HTTP response cache that every scraper can share.
+
+    Kayıtlar yöntem + URL + parametreler/gövde ile anahtarlanır ve uç noktaya (endpoint) göre belirlenen süre (TTL) boyunca geçerlidir.
+    Toplam boyut sınırı aşıldığında en uzun süredir kullanılmayan kayıtlar silinir (LRU).
+    Süresi dolan kayıtlar, sunucu destekliyorsa ETag/Last-Modified ile koşullu olarak yeniden doğrulanır.
+    Veritabanı dosyası birden fazla süreç tarafından aynı anda kullanılabilir.
+
+    Attributes:
+        path (str): Path of the SQLite database file; http_cache.sqlite3 in the cache directory (see CacheDir) by default.
+        max_bytes (int): Upper bound for the total size of the stored bodies.
+        ttl_rules (list): (url substring, ttl) pairs; ttl is seconds, FOREVER, or a callable(url, params, json_payload) returning one of them.
+
+    Methods:
+        key(method, url, params, json_payload):
+            Builds the cache key of a request.
+        ttl_for(method, url, params, json_payload):
+            Returns the time-to-live of a request according to ttl_rules.
+        get(key):
+            Returns the stored entry of a key, or None.
+        put(key, response, ttl):
+            Stores a successful response.
+        refresh(key, ttl):
+            Extends the lifetime of an entry after a 304 Not Modified answer.
+        clear():
+            Removes every entry.
+    """
+
+    FOREVER = math.inf
+
+    # Istek anahtarina dahil edilmeyen, onbellek kirmak icin kullanilan parametreler
+    IGNORED_PARAMS = {"_", "ts"}
+
+    def __init__(self, path=None, max_bytes=256 * 1024 * 1024, ttl_rules=None) -> None:
+        self.path = path if path is not None else cache_path("http_cache.sqlite3")
+        self.max_bytes = max_bytes
+        self.ttl_rules = ttl_rules if ttl_rules is not None else self.default_ttl_rules()
+        self.__lock = threading.Lock()
+        with connect(self.path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS yanitlar ("
+                "anahtar TEXT PRIMARY KEY, durum INTEGER, basliklar TEXT, icerik BLOB, etag TEXT, last_modified TEXT, "
+                "bitis REAL, son_erisim REAL, boyut INTEGER)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS yanitlar_son_erisim ON yanitlar (son_erisim)")
+
+    @staticmethod
+    def __closed_quarters(url, params, json_payload):
+        """
+        MaliTablo istekleri için TTL: istenen tüm çeyrekler kapanmış ve raporlama süresi geçmişse süresiz, aksi halde bir gün.
+        TTL for MaliTablo requests: forever if every requested quarter is closed and reported, otherwise one day.
+        """
+        params = params or {}
+        reported_before = date.today() - timedelta(days=120) # Yillik raporlar icin yasal sure
+        for i in range(1, 5):
+            year, period = params.get(f"year{i}"), params.get(f"period{i}")
+            if year is None or period is None:
+                continue
+            quarter_end = date(int(year), int(period), 1) + timedelta(days=31)
+            if quarter_end.replace(day=1) > reported_before:
+                return 24 * 60 * 60
+        return ResponseCache.FOREVER
+
+    @staticmethod
+    def __price_range(url, params, json_payload):
+        """
+        HisseTekil istekleri için TTL: bitiş tarihi geçmişte kalmışsa süresiz, aksi halde 15 dakika.
+        TTL for HisseTekil requests: forever if the range ended before today, otherwise 15 minutes.
+        """
+        end_date = (params or {}).get("enddate")
+        try:
+            if datetime.strptime(end_date, "%d-%m-%Y").date() < date.today():
+                return ResponseCache.FOREVER
+        except (TypeError, ValueError):
+            pass
+        return 15 * 60
+
+    @classmethod
+    def default_ttl_rules(cls) -> list:
+        """
+        Uç noktalara göre varsayılan önbellek süreleri. İlk eşleşen kural kullanılır; eşleşmeyen istekler önbelleğe alınmaz.
+        Default time-to-live per endpoint. The first matching rule wins; requests that match no rule are not cached.
+        """
+        minute, hour, day = 60, 60 * 60, 24 * 60 * 60
+        return [
+            ("Data.aspx/OneEndeks", 30),
+            ("ChartData.aspx/IndexHistoricalAll", hour),
+            ("Data.aspx/HisseTekil", cls.__price_range),
+            ("Data.aspx/MaliTablo", cls.__closed_quarters),
+            ("GetSermayeArttirimlari", day),
+            ("GetYabanciOranlarXHR", hour),
+            ("sirket-karti.aspx", day),
+            ("kap.org.tr/tr/api/disclosures", 5 * minute),
+            ("kap.org.tr/tr/FilterSgbf", 5 * minute),
+            ("kap.org.tr/tr/bist-sirketler", day),
+            ("kap.org.tr/tr/Endeksler", day),
+            ("kap.org.tr/tr/sirket-bilgileri", day),
+            ("query1.finance.yahoo.com/v8/finance/chart", 15 * minute),
+        ]
+
+    def key(self, method, url, params=None, json_payload=None) -> str:
+        """
+        İsteğin önbellek anahtarını oluşturur. Önbellek kırmak için eklenen zaman damgaları anahtara dahil edilmez.
+        Builds the cache key of a request. Cache-busting timestamps are left out of the key.
+
+        Returns:
+            str: The cache key.
+        """
+        parts = urlsplit(url)
+        query = parse_qsl(parts.query) + list((params or {}).items())
+        query = sorted((str(k), str(v)) for k, v in query if k not in self.IGNORED_PARAMS)
+        base = f"{parts.scheme}://{parts.netloc}{parts.path}"
+        payload = json.dumps(json_payload, sort_keys=True, ensure_ascii=False) if json_payload is not None else ""
+        return f"{method.upper()} {base}?{urlencode(query)} {payload}"
+
+    def ttl_for(self, method, url, params=None, json_payload=None):
+        """
+        İsteğin ttl_rules'a göre önbellekte kalma süresini geri verir.
+        Returns the time-to-live of a request according to ttl_rules.
+
+        Returns:
+            float: Seconds to keep the response; 0 means the response is not cached.
+        """
+        for pattern, ttl in self.ttl_rules:
+            if pattern in url:
+                return ttl(url, params, json_payload) if callable(ttl) else ttl
+        return 0
+
+    def get(self, key):
+        """
+        Anahtara ait kaydı geri verir ve son erişim zamanını günceller.
+        Returns the stored entry of a key and marks it as recently used.
+
+        Returns:
+            dict | None: Entry with status, headers, content, etag, last_modified and fresh fields.
+        """
+        now = time.time()
+        with connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT durum, basliklar, icerik, etag, last_modified, bitis FROM yanitlar WHERE anahtar = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE yanitlar SET son_erisim = ? WHERE anahtar = ?", (now, key))
+        status, headers, content, etag, last_modified, expires = row
+        return {
+            "status": status,
+            "headers": json.loads(headers),
+            "content": content,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh": expires is None or expires > now,
+        }
+
+    def put(self, key, response, ttl) -> None:
+        """
+        Başarılı bir yanıtı önbelleğe yazar ve gerekirse en eski kayıtları siler.
+        Stores a successful response and evicts least recently used entries if the size limit is exceeded.
+
+        Args:
+            key (str): The cache key.
+            response (requests.Response): The response to store.
+            ttl (float): Seconds to keep the response, or FOREVER.
+        """
+        now = time.time()
+        expires = None if ttl == self.FOREVER else now + ttl
+        content = response.content
+        headers = json.dumps(dict(response.headers))
+        with self.__lock, connect(self.path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO yanitlar VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, response.status_code, headers, content, response.headers.get("ETag"), response.headers.get("Last-Modified"), expires, now, len(content)),
+            )
+            self.__evict(conn)
+
+    def refresh(self, key, ttl) -> None:
+        """
+        304 Not Modified yanıtından sonra kaydın süresini uzatır.
+        Extends the lifetime of an entry after a 304 Not Modified answer.
+        """
+        now = time.time()
+        expires = None if ttl == self.FOREVER else now + ttl
+        with connect(self.path) as conn:
+            conn.execute("UPDATE yanitlar SET bitis = ?, son_erisim = ? WHERE anahtar = ?", (expires, now, key))
+
+    def __evict(self, conn) -> None:
+        """
+        Toplam boyut max_bytes'ı geçtiği sürece en uzun süredir kullanılmayan kayıtları siler.
+        Deletes least recently used entries while the total size exceeds max_bytes.
+        """
+        total = conn.execute("SELECT COALESCE(SUM(boyut), 0) FROM yanitlar").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute("SELECT anahtar, boyut FROM yanitlar ORDER BY son_erisim").fetchall():
+            conn.execute("DELETE FROM yanitlar WHERE anahtar = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self) -> None:
+        """
+        Önbellekteki tüm kayıtları siler.
+        Removes every entry.
+        """
+        with self.__lock, connect(self.path) as conn:
+            conn.execute("DELETE FROM yanitlar")
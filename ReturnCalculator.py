@@ -1,5 +1,8 @@
 from datetime import datetime
 from Yahoo import YahooFinancePriceDataFetcher
+from TradingCalendar import TradingCalendar
+from FxStore import FxStore
+import numpy as np
 import pandas as pd
 
 class ReturnCalculator:  
@@ -10,9 +13,11 @@ class ReturnCalculator:
         ticker (str): The stock ticker symbol for the company.
         period1 (str): The start date of the historical data collection period in "dd-mm-yyyy" format.
         period2 (str): The end date of the historical data collection period in "dd-mm-yyyy" format.
+        calendar (TradingCalendar): Trading days shared by the price and the USD/TRY series.
+        fx_store (FxStore): Process-wide store the USD/TRY series is sliced from.
 
     Methods:
-        __init__(ticker, period1, period2):
+        __init__(ticker, period1, period2, fx_store):
             Initializes the ReturnCalculator object with the given parameters, collects historical price data, and handles errors during initialization.
         preprocess_fiyatlar():
             Processes historical stock price and dividend data obtained from finance.yahoo, performs necessary adjustments, and returns a DataFrame.
@@ -22,9 +27,13 @@ class ReturnCalculator:
             Generates final DataFrames based on calculation type, reinvestment option, and investment amount.
         report(hesaplama_tipi, div_reinvest, tutar):
             Creates a report summarizing the investment calculation results, including total investment amount, total dividend income, total number of shares, and current portfolio value.
+        evaluate_scenarios(scenarios):
+            Computes df_maker() and report() for many (hesaplama_tipi, div_reinvest, tutar) combinations from one preprocessing pass.
+        rolling_returns(hesaplama_tipi, div_reinvest, tutar, horizon_months, step, percentiles):
+            Computes the final portfolio value of every start date within a horizon and their percentiles, vectorized across windows.
     """
 
-    def __init__(self, ticker, period1, period2) -> None:
+    def __init__(self, ticker, period1, period2, fx_store=None) -> None:
         """
         Initializes the ReturnCalculator object with the given parameters, collects historical price data, and handles errors during initialization.
 
@@ -32,41 +41,87 @@ class ReturnCalculator:
             ticker (str): The stock ticker symbol for the company.
             period1 (str): The start date of the historical data collection period in "dd-mm-yyyy" format.
             period2 (str): The end date of the historical data collection period in "dd-mm-yyyy" format.
+            fx_store (FxStore): Store the USD/TRY rates are read from. Defaults to the process-wide FxStore.shared().
         
         Raises:
             RuntimeError: If an error occurs during initialization.
         """
+        # On isleme asamalarinin onbellegi; girdi nesneleri degistiginde temizlenir.
+        self.__inputs = None
+        self.__stages = {}
         try:
             self.ticker = ticker
             self.period1 = period1
             self.period2 = period2
             self.price_df = YahooFinancePriceDataFetcher().get_prices_from_yahoo(company_code=ticker, period_1=period1, period_2=period2)
-            self.currency = YahooFinancePriceDataFetcher().get_prices_from_yahoo(company_code="USDTRY=X", period_1=period1, period_2=period2)
+            # Kur verisi surec genelinde paylasilan depodan kesilir; yalnizca eksik uclar indirilir.
+            self.fx_store = fx_store if fx_store is not None else FxStore.shared()
+            self.currency = self.fx_store.get(pair="USDTRY=X", period_1=period1, period_2=period2)
             if len(self.price_df) == 1:
                 raise ValueError("Fiyatlar cekilirken hata olustu.")
+            # Hisse ve kur verisinin ortak oldugu gunlerden olusan islem gunu takvimi
+            self.calendar = TradingCalendar()
+            self.calendar.learn(pd.Index(pd.to_datetime(self.price_df["TARIH"])).intersection(pd.to_datetime(self.currency["TARIH"])))
         except Exception as e:
             raise RuntimeError(f"Error occurred during initialization: {e}")
 
     def preprocess_fiyatlar(self):
-
         """
         Processes historical stock price and dividend data obtained from finance.yahoo, performs necessary adjustments, and returns a DataFrame.
+
+        Sonuç nesne üzerinde önbelleğe alınır; price_df ve currency değiştirilmez. Önbellekteki tablonun bozulmaması
+        için bir kopyası geri verilir.
         
         Returns:
             pd.DataFrame: A pandas DataFrame containing processed historical stock price and dividend data, including columns for date, stock ticker symbol, USD/TRY exchange rate, closing price in TRY and USD, dividends in TRY, and adjusted dividends in TRY.
         """
-        # Hisseye ait tarihsel fiyat bilgisi
-        f = self.price_df
-        f["HISSE KODU"] = self.ticker
-        cols_to_keep = ["TARIH", "HISSE KODU", "KAPANIS-yahoo", "TEMETTU (TL)"]
-        f = f[cols_to_keep].reset_index(drop=True)
-        f.rename(columns={"KAPANIS-yahoo":"HISSE KAPANIS FIYATI (TL)"}, inplace=True)
+        return self.__stage("fiyatlar", self.__preprocess).copy()
+
+    def process(self, hesaplama_tipi):
+        """
+        Processes the price DataFrame based on dividend dates and calculation type.
+
+        Parameters:
+            hesaplama_tipi (str): The type of calculation, either "duzenli" for regular investments or "tek" for one-time investments.
+
+        Returns:
+            pd.DataFrame: A DataFrame containing the processed price and dividend data.
+        """
+        return self.__processed(hesaplama_tipi).copy()
+
+    def __stage(self, name, build):
+        """
+        Ara sonucu önbellekten verir; girdiler (ticker, price_df, currency, calendar) değiştiyse önbelleği temizler.
+        Returns a cached intermediate result, clearing the cache when an input object has been replaced.
+        """
+        inputs = (self.ticker, self.price_df, self.currency, self.calendar)
+        if self.__inputs is None or any(old is not new for old, new in zip(self.__inputs, inputs)):
+            self.__inputs = inputs
+            self.__stages = {}
+        if name not in self.__stages:
+            self.__stages[name] = build()
+        return self.__stages[name]
+
+    def __processed(self, hesaplama_tipi):
+        """
+        Hesaplama tipine göre seçilmiş satırları önbellekten verir.
+        Returns the cached event rows of the calculation type.
+        """
+        return self.__stage(("islem", hesaplama_tipi), lambda: self.__select_events(self.__stage("fiyatlar", self.__preprocess), hesaplama_tipi))
+
+    def __preprocess(self):
+        """
+        Hisse ve kur verisini birleştirir, USD fiyatı ve net temettüyü hesaplar.
+        Merges the stock and the FX series and computes the USD price and the net dividend.
+        """
+        # Hisseye ait tarihsel fiyat bilgisi; price_df degistirilmez.
+        f = self.price_df[["TARIH", "KAPANIS-yahoo", "TEMETTU (TL)"]].reset_index(drop=True)
+        f.insert(1, "HISSE KODU", self.ticker)
+        f = f.rename(columns={"KAPANIS-yahoo":"HISSE KAPANIS FIYATI (TL)"})
 
         # Ayni zaman dilimine ait dolar/tl bilgisi
-        c = self.currency
-        cols_to_keep = ["TARIH", "KAPANIS-yahoo"]
-        c = c[cols_to_keep].reset_index(drop=True)
-        c.rename(columns={"KAPANIS-yahoo":"USD/TRY"}, inplace=True)
+        c = self.currency[["TARIH", "KAPANIS-yahoo"]].reset_index(drop=True)
+        c = c.rename(columns={"KAPANIS-yahoo":"USD/TRY"})
         
         # Bu iki dataframei birlestirir ve ek duzenlemeler yapar
         df = pd.merge(left=c, right=f, on="TARIH")
@@ -76,40 +131,36 @@ class ReturnCalculator:
 
         #  22 Aralik 2021 oncesi stopaj vergisi %15 iken bu tarih sonrasinda %10 seviyesine indirilmistir
         cond = df["TARIH"] > datetime(2021, 12, 22)
-        df["NET TEMETTU (TL)"] = df["TEMETTU (TL)"] * .9
-        df.loc[~cond, "NET TEMETTU (TL)"] = df["TEMETTU (TL)"] * .85
-        df = df[col_order]
-        return df
-    
-    def process(self, hesaplama_tipi):
-        """
-        Processes the price DataFrame based on dividend dates and calculation type.
+        df["NET TEMETTU (TL)"] = df["TEMETTU (TL)"] * np.where(cond, .9, .85)
+        return df[col_order]
 
-        Parameters:
-            hesaplama_tipi (str): The type of calculation, either "duzenli" for regular investments or "tek" for one-time investments.
+    def __select_events(self, fiyat_df, hesaplama_tipi):
+        """
+        Alım ve temettü günlerine ait satırları konum dizini ile seçer.
+        Selects the purchase and dividend rows by their positions in the date-sorted price DataFrame.
 
-        Returns:
-            pd.DataFrame: A DataFrame containing the processed price and dividend data.
+        Alım günü aynı zamanda temettü günüyse satır iki kez yer alır: ilki alım, ikincisi temettü satırıdır.
         """
-        # Fiyat dataframeini okur
-        fiyat_df = self.preprocess_fiyatlar()
+        tarih = fiyat_df["TARIH"].to_numpy()
+        # Tek seferlik alimlarda istenen tarih araliginin en basinda alim yapilir
+        if hesaplama_tipi == "tek":
+            dates_price = [tarih[0], tarih[-1]]
         # Duzenli alimlarda her ayin ilk gunu belli tutarlarda alim yapilmasi ongorulur
-        if hesaplama_tipi == "duzenli":
-            # Istenen tarih araligindaki ayin ilk is gunlerini verir
-            dates_price = fiyat_df.groupby([fiyat_df["TARIH"].dt.year, fiyat_df["TARIH"].dt.month + 1])["TARIH"].min().reset_index(drop=True)[1:]
-            # Istenen tarih araligindaki ilk ve son is gunlerini verir
-            first_last = pd.Series([fiyat_df.iloc[0]["TARIH"], fiyat_df.iloc[-1]["TARIH"]])
-            # Bu tarihleri bir Seri olarak birlestirir.
-            dates_price = pd.concat([dates_price, first_last]).reset_index(drop=True)
+        elif hesaplama_tipi == "duzenli":
+            # Istenen tarih araligindaki ayin ilk is gunleri (ilk ay haric) ile ilk ve son is gunleri
+            dates_price = list(self.calendar.first_trading_days_of_months(fiyat_df.iloc[0]["TARIH"], fiyat_df.iloc[-1]["TARIH"])[1:])
+            dates_price += [tarih[0], tarih[-1]]
+        else:
+            raise ValueError(f"Gecersiz hesaplama tipi: {hesaplama_tipi}")
 
-        # Tek seferlik alimlarda istenen tarih araliginin en basinda alim yapilir
-        elif hesaplama_tipi == "tek": # tek seferlik
-            dates_price = pd.Series([fiyat_df.iloc[0]["TARIH"], fiyat_df.iloc[-1]["TARIH"]])
-        
-        # Temettu dagitimi olan gunlere gore filtreler
-        dates_div = fiyat_df[fiyat_df["TEMETTU (TL)"] != 0]["TARIH"].to_list()
-        new_fiyat_df = pd.concat([fiyat_df[fiyat_df["TARIH"].isin(dates_price)], fiyat_df[fiyat_df["TARIH"].isin(dates_div)]]).sort_values(by="TARIH")
-        return new_fiyat_df.reset_index(drop=True)
+        # Tarihler sirali oldugu icin alim gunlerinin konumlari ikili arama ile bulunur.
+        dates_price = np.asarray(pd.to_datetime(dates_price), dtype=tarih.dtype)
+        price_pos = np.searchsorted(tarih, dates_price).clip(max=len(tarih) - 1)
+        price_pos = np.unique(price_pos[tarih[price_pos] == dates_price])
+        # Temettu dagitimi olan gunlerin konumlari
+        div_pos = np.flatnonzero(fiyat_df["TEMETTU (TL)"].to_numpy() != 0)
+        positions = np.sort(np.concatenate([price_pos, div_pos]), kind="stable")
+        return fiyat_df.iloc[positions].reset_index(drop=True)
 
     def df_maker(self, hesaplama_tipi, div_reinvest, tutar):
         """
@@ -123,55 +174,161 @@ class ReturnCalculator:
         Returns:
             pd.DataFrame: A DataFrame containing the final calculations.
         """
-        df = self.process(hesaplama_tipi=hesaplama_tipi)
+        return self.__build(self.__processed(hesaplama_tipi).copy(), hesaplama_tipi, div_reinvest, tutar)
+
+    def evaluate_scenarios(self, scenarios) -> dict:
+        """
+        Birden fazla senaryoyu tek bir indirme ve ön işleme üzerinden hesaplar.
+        Evaluates many scenarios from a single download and preprocessing pass.
+
+        Fiyat ve kur verisi nesne oluşturulurken bir kez indirilir; ön işleme ve hesaplama tipine göre satır seçimi nesne
+        üzerinde önbelleğe alınır. Tüm senaryolar bu ortak tablolar üzerinden yan yana hesaplanır.
+
+        Parameters:
+            scenarios (list): (hesaplama_tipi, div_reinvest, tutar) tuples, e.g. [("tek", True, 1000), ("tek", False, 1000)].
+
+        Returns:
+            dict: (hesaplama_tipi, div_reinvest, tutar) -> (DataFrame of df_maker(), dict of report()).
+        """
+        results = {}
+        for hesaplama_tipi, div_reinvest, tutar in scenarios:
+            return_df = self.df_maker(hesaplama_tipi=hesaplama_tipi, div_reinvest=div_reinvest, tutar=tutar)
+            results[(hesaplama_tipi, div_reinvest, tutar)] = (return_df, self.__summarize(return_df, hesaplama_tipi, div_reinvest))
+        return results
+
+    def rolling_returns(self, hesaplama_tipi, div_reinvest, tutar, horizon_months=36, step="month", percentiles=(5, 25, 50, 75, 95)) -> dict:
+        """
+        Veri aralığındaki her olası başlangıç tarihi için horizon_months uzunluğundaki yatırımın sonucunu hesaplar.
+        Computes the outcome of a horizon_months long investment for every possible start date in the data, e.g. all
+        3-year windows of the last 15 years.
+
+        Pencereler tek tek hesaplanmaz; tüm pencerelerin durumu (lot, artan para, temettü geliri) NumPy dizilerinde
+        tutulur ve alım/temettü günleri üzerinden tek geçişte, tüm pencereler için aynı anda ilerletilir. Her pencerenin
+        sonucu, aynı aralık için oluşturulan bir ReturnCalculator'ın report() çıktısındaki güncel portföy değerine eşittir.
+
+        Parameters:
+            hesaplama_tipi (str): The type of calculation, either "duzenli" for regular investments or "tek" for one-time investments.
+            div_reinvest (bool): A boolean indicating whether dividends should be reinvested.
+            tutar (float): The investment amount.
+            horizon_months (int, optional): Length of each window in months. Defaults to 36.
+            step (str, optional): "month" starts a window on the first trading day of every month, "day" on every trading day. Defaults to "month".
+            percentiles (tuple, optional): Percentiles of the final portfolio values to report. Defaults to (5, 25, 50, 75, 95).
+
+        Returns:
+            dict: "pencereler": DataFrame with BASLANGIC, BITIS, PORTFOY-TL and PORTFOY-USD of every window;
+                  "yuzdelikler": DataFrame of the requested percentiles of PORTFOY-TL and PORTFOY-USD.
+
+        Raises:
+            ValueError: If the calculation type or step is invalid, or no full window fits in the data.
+        """
+        if hesaplama_tipi not in ("tek", "duzenli"):
+            raise ValueError(f"Gecersiz hesaplama tipi: {hesaplama_tipi}")
+        df = self.__stage("fiyatlar", self.__preprocess)
+        tarih = df["TARIH"].to_numpy()
+        fiyat = df["HISSE KAPANIS FIYATI (TL)"].to_numpy(dtype=float)
+        fiyat_usd = df["HISSE KAPANIS FIYATI (USD)"].to_numpy(dtype=float)
+        kur = df["USD/TRY"].to_numpy(dtype=float)
+        net_tem = df["NET TEMETTU (TL)"].to_numpy(dtype=float)
+        temettu_gunu = df["TEMETTU (TL)"].to_numpy() != 0
+
+        # Ayin ilk islem gunlerinin ve temettu gunlerinin konumlari
+        ay_basi = np.asarray(self.calendar.first_trading_days_of_months(tarih[0], tarih[-1]), dtype=tarih.dtype)
+        ay_basi = np.searchsorted(tarih, ay_basi)
+        temettu = np.flatnonzero(temettu_gunu)
+
+        # Pencerelerin baslangic ve bitis konumlari; bitis, vadeyi asmayan son islem gunudur.
+        if step == "month":
+            starts = ay_basi
+        elif step == "day":
+            starts = np.arange(len(tarih))
+        else:
+            raise ValueError(f"Gecersiz adim: {step}")
+        targets = (pd.DatetimeIndex(tarih[starts]) + pd.DateOffset(months=horizon_months)).to_numpy().astype(tarih.dtype)
+        ends = np.searchsorted(tarih, targets, side="right") - 1
+        valid = (targets <= tarih[-1]) & (ends > starts)
+        starts, ends = starts[valid], ends[valid]
+        if len(starts) == 0:
+            raise ValueError(f"Veri araligi {horizon_months} aylik bir pencere icin yeterli degil.")
+
+        # Pencere bazli durum: toplam lot, devreden para, son islenen satirin ARTAN (TL) degeri ve kuru, temettu geliri
+        n = len(starts)
+        lot = np.zeros(n)
+        kalan = np.zeros(n)
+        artan = np.zeros(n)
+        son_kur = np.zeros(n)
+        tem_geliri = np.zeros(n)
+        tem_geliri_usd = np.zeros(n)
+
+        def satir_isle(positions, active):
+            """
+            Verilen konumdaki satırı aktif pencereler için işler (df_maker() ile aynı kurallar).
+            Applies the row at the given positions to the active windows, following the rules of df_maker().
+            """
+            nonlocal lot, kalan, artan, son_kur, tem_geliri, tem_geliri_usd
+            temettu_satiri = active & temettu_gunu[positions]
+            alim_satiri = active & ~temettu_gunu[positions] & (hesaplama_tipi == "duzenli")
+            tem = np.where(temettu_satiri, net_tem[positions] * lot, 0.0)
+            tem_geliri = tem_geliri + tem
+            tem_geliri_usd = tem_geliri_usd + tem / kur[positions]
+            islem = alim_satiri | (temettu_satiri & div_reinvest)
+            nakit = np.where(alim_satiri, tutar + kalan, np.where(islem, tem + kalan, 0.0))
+            lot = lot + np.where(islem, nakit // fiyat[positions], 0.0)
+            kalan = np.where(islem, nakit % fiyat[positions], kalan)
+            # Tek seferlik yatirimda temettu geri yatirilmiyorsa ilk satirdan sonraki ARTAN (TL) degerleri sifirdir.
+            artan = np.where(active, 0.0 if hesaplama_tipi == "tek" and not div_reinvest else kalan, artan)
+            son_kur = np.where(active, kur[positions], son_kur)
+
+        everyone = np.ones(n, dtype=bool)
+        if hesaplama_tipi == "tek":
+            # Ilk gun tum tutar ile alim yapilir; sonraki satirlarin tamami temettu satiridir.
+            lot = tutar // fiyat[starts]
+            kalan = tutar % fiyat[starts]
+            artan = kalan.copy()
+            son_kur = kur[starts].copy()
+            events = temettu
+        else:
+            satir_isle(starts, everyone)
+            events = np.sort(np.concatenate([ay_basi, temettu]), kind="stable")
+        # Baslangic gunu temettu gunuyse o gun icin ikinci bir temettu satiri vardir.
+        satir_isle(starts, temettu_gunu[starts])
+        # Pencerelerin ic kismindaki ortak satirlar tum pencereler icin birlikte islenir.
+        for position in events:
+            satir_isle(np.full(n, position), (starts < position) & (position < ends))
+        # Bitis gunu temettu gunuyse son satirdan onceki temettu satiri da islenir; son satir islenmez.
+        satir_isle(ends, temettu_gunu[ends])
+
+        portfoy_tl = lot * fiyat[ends] + artan
+        portfoy_usd = lot * fiyat_usd[ends] + artan / son_kur
+        if not div_reinvest:
+            portfoy_tl += tem_geliri
+            portfoy_usd += tem_geliri_usd
+
+        pencereler = pd.DataFrame({
+            "BASLANGIC": tarih[starts],
+            "BITIS": tarih[ends],
+            "PORTFOY-TL": portfoy_tl,
+            "PORTFOY-USD": portfoy_usd,
+        })
+        yuzdelikler = pd.DataFrame({
+            "PORTFOY-TL": np.percentile(portfoy_tl, percentiles),
+            "PORTFOY-USD": np.percentile(portfoy_usd, percentiles),
+        }, index=pd.Index(percentiles, name="YUZDELIK"))
+        return {"pencereler": pencereler, "yuzdelikler": yuzdelikler}
+
+    def __build(self, df, hesaplama_tipi, div_reinvest, tutar):
+        """
+        İşlenmiş tabloya yatırım sütunlarını ekler.
+        Adds the investment columns to a processed DataFrame in place and returns it.
+        """
+        fiyat = df["HISSE KAPANIS FIYATI (TL)"].to_numpy(dtype=float)
+        net_tem = df["NET TEMETTU (TL)"].to_numpy(dtype=float)
+        # Gecersiz hesaplama tipi __select_events'te reddedilir.
         if hesaplama_tipi == "tek":
-            baslangic_lot = tutar // df.loc[0, "HISSE KAPANIS FIYATI (TL)"]
-            artan = tutar % df.loc[0, "HISSE KAPANIS FIYATI (TL)"]
-            df["BASLANGIC YATIRIM (TL)"] = df.apply(lambda row: tutar if row.name == 0 else 0, axis=1)
-            df["TEMETTU GELIRI (TL)"] = 0.0
-            df["TEMETTU GELIRI + ARTAN (TL)"] = 0.0
-            df["LOT"] = df.apply(lambda row: baslangic_lot if row.name == 0 else 0, axis=1)
-            df["HARCANAN (TL)"] = df.apply(lambda row: baslangic_lot * row["HISSE KAPANIS FIYATI (TL)"] if row.name == 0 else 0, axis=1)
-            df["ARTAN (TL)"] = df.apply(lambda row: artan if row.name == 0 else 0, axis=1)
-            for i in range(1, len(df) - 1):
-                toplam_tem = df.loc[i, "NET TEMETTU (TL)"] * df.loc[:i, "LOT"].sum()
-                df.loc[i, "TEMETTU GELIRI (TL)"] = toplam_tem
-                if div_reinvest:
-                    tem_ve_artan = toplam_tem + df.loc[df.index[i-1], "ARTAN (TL)"]
-                    lot = tem_ve_artan // df.loc[i, "HISSE KAPANIS FIYATI (TL)"]
-                    artan = tem_ve_artan % df.loc[i, "HISSE KAPANIS FIYATI (TL)"]
-                    harcanan = lot * df.loc[i, "HISSE KAPANIS FIYATI (TL)"]
-                    df.loc[i, "TEMETTU GELIRI + ARTAN (TL)"], df.loc[i, "LOT"] = tem_ve_artan, lot
-                    df.loc[i, "ARTAN (TL)"], df.loc[i, "HARCANAN (TL)"] = artan, harcanan
-                else:
-                    pass
-                   
-        elif hesaplama_tipi == "duzenli":
-            artan = 0.0
-            df["AYLIK YATIRIM TUTARI + ARTAN (TL)"] = 0.0
-            df["TEMETTU GELIRI (TL)"] = 0.0
-            df["LOT"] = 0.0
-            df["HARCANAN (TL)"] = 0.0 
-            df["ARTAN (TL)"] = 0.0
-            for i in range(len(df) - 1):
-                hb_net_tem = df.loc[i, "NET TEMETTU (TL)"]
-                if hb_net_tem == 0:
-                    df.loc[i, "AYLIK YATIRIM TUTARI + ARTAN (TL)"] = (tutar + artan)
-                    lot = (tutar + artan) // df.loc[i, "HISSE KAPANIS FIYATI (TL)"]
-                    artan = (tutar + artan) % df.loc[i, "HISSE KAPANIS FIYATI (TL)"]
-                    harcanan = lot * df.loc[i, "HISSE KAPANIS FIYATI (TL)"]
-                    df.loc[i, "LOT"], df.loc[i, "HARCANAN (TL)"], df.loc[i, "ARTAN (TL)"] = lot, harcanan, artan
-                else:
-                    df.loc[i, "TEMETTU GELIRI (TL)"] = hb_net_tem * df.loc[:i, "LOT"].sum()
-                    if div_reinvest: 
-                        df.loc[i, "AYLIK YATIRIM TUTARI + ARTAN (TL)"] = df.loc[i, "TEMETTU GELIRI (TL)"] + artan
-                        lot = df.loc[i, "AYLIK YATIRIM TUTARI + ARTAN (TL)"] // df.loc[i, "HISSE KAPANIS FIYATI (TL)"]
-                        artan = df.loc[i, "AYLIK YATIRIM TUTARI + ARTAN (TL)"] % df.loc[i, "HISSE KAPANIS FIYATI (TL)"]
-                        harcanan = lot * df.loc[i, "HISSE KAPANIS FIYATI (TL)"]
-                        df.loc[i, "LOT"], df.loc[i, "HARCANAN (TL)"], df.loc[i, "ARTAN (TL)"] = lot, harcanan, artan
-                    else:
-                        artan = df.loc[i-1, "ARTAN (TL)"]
-                        df.loc[i, "ARTAN (TL)"] = artan
+            columns = self.__tek_engine(fiyat, net_tem, div_reinvest, tutar)
+        else:
+            columns = self.__duzenli_engine(fiyat, net_tem, div_reinvest, tutar)
+        for column, values in columns.items():
+            df[column] = values
         df["LOT-kumulatif"] = df["LOT"].cumsum()
         df["PORTFOY-TL"] = df["HISSE KAPANIS FIYATI (TL)"] * df["LOT-kumulatif"]
         df["PORTFOY-USD"] = df["HISSE KAPANIS FIYATI (USD)"] * df["LOT-kumulatif"]
@@ -180,6 +337,106 @@ class ReturnCalculator:
             df["PORTFOY-USD"] += df["TEMETTU GELIRI (TL)"] / df["USD/TRY"]
         return df
     
+    @staticmethod
+    def __tek_engine(fiyat, net_tem, div_reinvest, tutar) -> dict:
+        """
+        Tek seferlik yatırımın satır bazlı sütunlarını tek geçişte hesaplar.
+        Computes the per-row columns of a one-time investment in a single pass over NumPy arrays.
+
+        Parameters:
+            fiyat (np.ndarray): Closing prices in TRY of the processed rows.
+            net_tem (np.ndarray): Net dividends per share in TRY of the processed rows.
+            div_reinvest (bool): Whether dividends are reinvested.
+            tutar (float): The investment amount.
+
+        Returns:
+            dict: Column name -> np.ndarray, in the column order of df_maker().
+        """
+        n = len(fiyat)
+        baslangic = np.zeros(n)
+        tem_geliri = np.zeros(n)
+        tem_ve_artan = np.zeros(n)
+        lot = np.zeros(n)
+        harcanan = np.zeros(n)
+        artan = np.zeros(n)
+
+        # Ilk gun tum tutar ile alim yapilir
+        baslangic[0] = tutar
+        lot[0] = tutar // fiyat[0]
+        harcanan[0] = lot[0] * fiyat[0]
+        artan[0] = tutar % fiyat[0]
+
+        # Son satir guncel degeri temsil eder; islem yapilmaz.
+        kumulatif_lot = lot[0]
+        for i in range(1, n - 1):
+            tem_geliri[i] = net_tem[i] * kumulatif_lot
+            if div_reinvest:
+                tem_ve_artan[i] = tem_geliri[i] + artan[i - 1]
+                lot[i] = tem_ve_artan[i] // fiyat[i]
+                artan[i] = tem_ve_artan[i] % fiyat[i]
+                harcanan[i] = lot[i] * fiyat[i]
+                kumulatif_lot += lot[i]
+
+        return {
+            "BASLANGIC YATIRIM (TL)": baslangic,
+            "TEMETTU GELIRI (TL)": tem_geliri,
+            "TEMETTU GELIRI + ARTAN (TL)": tem_ve_artan,
+            "LOT": lot,
+            "HARCANAN (TL)": harcanan,
+            "ARTAN (TL)": artan,
+        }
+
+    @staticmethod
+    def __duzenli_engine(fiyat, net_tem, div_reinvest, tutar) -> dict:
+        """
+        Düzenli yatırımın satır bazlı sütunlarını tek geçişte hesaplar.
+        Computes the per-row columns of a regular (monthly) investment in a single pass over NumPy arrays.
+
+        Temettü olmayan satırlarda aylık tutar ve bir önceki alımdan artan para ile alım yapılır. Temettü satırlarında o
+        güne kadar birikmiş lot üzerinden temettü geliri hesaplanır; geri yatırım seçiliyse bu gelir ile alım yapılır.
+
+        Parameters:
+            fiyat (np.ndarray): Closing prices in TRY of the processed rows.
+            net_tem (np.ndarray): Net dividends per share in TRY of the processed rows.
+            div_reinvest (bool): Whether dividends are reinvested.
+            tutar (float): The monthly investment amount.
+
+        Returns:
+            dict: Column name -> np.ndarray, in the column order of df_maker().
+        """
+        n = len(fiyat)
+        aylik = np.zeros(n)
+        tem_geliri = np.zeros(n)
+        lot = np.zeros(n)
+        harcanan = np.zeros(n)
+        artan = np.zeros(n)
+
+        # Birikmis lot ve bir sonraki alima devreden para tek geciste tasinir.
+        kalan = 0.0
+        kumulatif_lot = 0.0
+        for i in range(n - 1):
+            if net_tem[i] == 0:
+                aylik[i] = tutar + kalan
+            else:
+                tem_geliri[i] = net_tem[i] * kumulatif_lot
+                if not div_reinvest:
+                    artan[i] = kalan
+                    continue
+                aylik[i] = tem_geliri[i] + kalan
+            lot[i] = aylik[i] // fiyat[i]
+            kalan = aylik[i] % fiyat[i]
+            harcanan[i] = lot[i] * fiyat[i]
+            artan[i] = kalan
+            kumulatif_lot += lot[i]
+
+        return {
+            "AYLIK YATIRIM TUTARI + ARTAN (TL)": aylik,
+            "TEMETTU GELIRI (TL)": tem_geliri,
+            "LOT": lot,
+            "HARCANAN (TL)": harcanan,
+            "ARTAN (TL)": artan,
+        }
+
     def report(self, hesaplama_tipi, div_reinvest, tutar):
         """
         Generates a report for the calculation.
@@ -193,6 +450,14 @@ class ReturnCalculator:
             dict: A dictionary containing the report information.
         """
         return_df = self.df_maker(hesaplama_tipi=hesaplama_tipi, div_reinvest=div_reinvest, tutar=tutar)
+        return self.__summarize(return_df, hesaplama_tipi, div_reinvest)
+
+    @staticmethod
+    def __summarize(return_df, hesaplama_tipi, div_reinvest) -> dict:
+        """
+        df_maker() çıktısından rapor sözlüğünü üretir.
+        Builds the report dictionary from an output of df_maker().
+        """
         toplam_lot = return_df["LOT"].sum()
         guncel_fiyat = return_df.loc[return_df.index[-1], "HISSE KAPANIS FIYATI (TL)"]
         guncel_fiyat_usd = return_df.loc[return_df.index[-1], "HISSE KAPANIS FIYATI (USD)"]
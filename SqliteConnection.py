@@ -0,0 +1,21 @@
+import sqlite3
+from contextlib import contextmanager
+
+@contextmanager
+def connect(path:str, timeout:float=30):
+    """
+    SQLite bağlantısı açar; başarılı olursa işlemi onaylar, hata olursa geri alır ve bağlantıyı her durumda kapatır.
+    Opens a connection that commits on success, rolls back on error and is always closed.
+
+    PriceStore, FxStore ve ResponseCache veritabanlarına bu fonksiyon ile bağlanır.
+
+    Args:
+        path (str): Path of the SQLite database file.
+        timeout (float, optional): Seconds to wait for a lock held by another connection. Defaults to 30.
+    """
+    conn = sqlite3.connect(path, timeout=timeout)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
@@ -0,0 +1,207 @@
+import os
+import threading
+import numpy as np
+import pandas as pd
+from CacheDir import cache_path
+
+class TradingCalendar(object):
+    """
+    İndirilmiş endeks (XU100) fiyat verilerinden öğrenilen BIST işlem günleri takvimi.
+    A BIST trading-day calendar learned from index (XU100) price data that has already been downloaded.
+
+    İşlem günleri sıralı bir numpy dizisinde tutulur; tüm sorgular ikili arama (np.searchsorted) ile O(log n) sürede yanıtlanır.
+    Takvim, hangi tarih aralıklarının öğrenildiğini de saklar; böylece bilinmeyen bir aralık için yanlış cevap verilmez.
+    Bir dosya yolu verilirse takvim her güncellemede diske yazılır ve bir sonraki açılışta okunur.
+
+    Attributes:
+        path (str): Optional .npz file the calendar is persisted to.
+        INDEX_TICKER (str): The index whose price responses the shared calendar is learned from.
+
+    Methods:
+        shared():
+            Returns the process-wide calendar, creating it on first use.
+        learn(dates, start, end):
+            Adds trading days seen in an index price response and marks the requested range as learned.
+        covers(start, end):
+            Whether the whole range has been learned.
+        is_trading_day(day):
+            Whether the day is a trading day.
+        next_trading_day(day, inclusive):
+            The first trading day after (or on) the day.
+        previous_trading_day(day, inclusive):
+            The last trading day before (or on) the day.
+        trading_days(start, end):
+            Trading days in the range.
+        first_trading_day_of_month(year, month):
+            The first trading day of the month.
+        first_trading_days_of_months(start, end):
+            The first trading day of every month in the range.
+    """
+
+    # Takvimin ogrenildigi endeks; tek bir hissenin islem yasagi olan gunleri tatil olarak ogrenilmemelidir.
+    INDEX_TICKER = "XU100"
+
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path=None) -> None:
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__days = np.array([], dtype="datetime64[D]")
+        # Ogrenilen araliklar; baslangic ve bitis gunleri ayri dizilerde, sirali ve birbirine degmeyecek sekilde tutulur.
+        self.__range_starts = np.array([], dtype="datetime64[D]")
+        self.__range_ends = np.array([], dtype="datetime64[D]")
+        if path is not None and os.path.exists(path):
+            with np.load(path) as stored:
+                # Tek hisselerden ogrenilmis eski dosyalar sahte tatiller icerebilir; bunlar okunmaz ve takvim yeniden ogrenilir.
+                if "index_ticker" not in stored.files or str(stored["index_ticker"]) != self.INDEX_TICKER:
+                    return
+                self.__days = stored["days"]
+                self.__range_starts = stored["range_starts"]
+                self.__range_ends = stored["range_ends"]
+
+    @classmethod
+    def shared(cls):
+        """
+        Süreç genelinde paylaşılan ve diske kaydedilen takvimi geri verir; ilk çağrıda oluşturur.
+        Returns the process-wide calendar persisted to islem_gunleri.npz in the cache directory (see CacheDir), creating it on first use.
+
+        Returns:
+            TradingCalendar: The shared calendar.
+        """
+        if cls._shared_instance is None:
+            with cls._shared_lock:
+                if cls._shared_instance is None:
+                    cls._shared_instance = cls(path=cache_path("islem_gunleri.npz"))
+        return cls._shared_instance
+
+    @staticmethod
+    def _to_day(value) -> np.datetime64:
+        """
+        Converts a dd-mm-YYYY string, date, datetime, pd.Timestamp or np.datetime64 to np.datetime64[D].
+        """
+        if isinstance(value, str):
+            value = pd.to_datetime(value, format="%d-%m-%Y")
+        return np.datetime64(pd.Timestamp(value).date(), "D")
+
+    def learn(self, dates, start=None, end=None) -> None:
+        """
+        Bir endeks fiyat yanıtında görülen işlem günlerini takvime ekler.
+        Adds the trading days seen in an index price response to the calendar.
+
+        Aralıkta yanıtta bulunmayan her gün tatil kabul edilir; bu yüzden yalnızca her işlem gününde verisi olan
+        endeks yanıtları öğretilmelidir. Boş yanıtlar takvimi değiştirmez. Takvim yalnızca gerçekten değiştiğinde diske yazılır.
+
+        Args:
+            dates (iterable): Trading days in the response (e.g. the TARIH column).
+            start (optional): Start of the requested range. Defaults to the first date.
+            end (optional): End of the requested range. Defaults to the last date.
+        """
+        days = pd.to_datetime(pd.Series(dates)).dropna().to_numpy().astype("datetime64[D]")
+        if len(days) == 0:
+            return
+        start = self._to_day(start) if start is not None else days.min()
+        end = self._to_day(end) if end is not None else days.max()
+        with self.__lock:
+            merged_days = np.union1d(self.__days, days)
+            changed = len(merged_days) != len(self.__days)
+            self.__days = merged_days
+            if start <= end and not self.covers(start, end):
+                self.__add_range(start, end)
+                changed = True
+            if changed and self.path is not None:
+                self.__save()
+
+    def __add_range(self, start, end) -> None:
+        """
+        Yeni aralığı mevcut aralıklarla birleştirir.
+        Merges the new range into the learned ranges.
+        """
+        starts = np.append(self.__range_starts, start)
+        ends = np.append(self.__range_ends, end)
+        order = np.argsort(starts)
+        starts, ends = starts[order], ends[order]
+        merged_starts, merged_ends = [starts[0]], [ends[0]]
+        for range_start, range_end in zip(starts[1:], ends[1:]):
+            if range_start <= merged_ends[-1] + np.timedelta64(1, "D"):
+                merged_ends[-1] = max(merged_ends[-1], range_end)
+            else:
+                merged_starts.append(range_start)
+                merged_ends.append(range_end)
+        self.__range_starts = np.array(merged_starts, dtype="datetime64[D]")
+        self.__range_ends = np.array(merged_ends, dtype="datetime64[D]")
+
+    def __save(self) -> None:
+        """
+        Takvimi geçici bir dosyaya yazar ve atomik olarak yerine koyar.
+        Writes the calendar to a temporary file and atomically moves it into place.
+        """
+        temporary = f"{self.path}.{os.getpid()}.tmp.npz"
+        np.savez(temporary, index_ticker=self.INDEX_TICKER, days=self.__days, range_starts=self.__range_starts, range_ends=self.__range_ends)
+        os.replace(temporary, self.path)
+
+    def covers(self, start, end) -> bool:
+        """
+        Verilen aralığın tamamının öğrenilip öğrenilmediğini geri verir.
+        Whether the whole range has been learned.
+        """
+        start, end = self._to_day(start), self._to_day(end)
+        i = np.searchsorted(self.__range_starts, start, side="right") - 1
+        return bool(i >= 0 and self.__range_ends[i] >= end)
+
+    def is_trading_day(self, day) -> bool:
+        """
+        Verilen günün işlem günü olup olmadığını geri verir.
+        Whether the day is a trading day.
+        """
+        day = self._to_day(day)
+        i = np.searchsorted(self.__days, day)
+        return bool(i < len(self.__days) and self.__days[i] == day)
+
+    def next_trading_day(self, day, inclusive=False):
+        """
+        Verilen günden sonraki (inclusive=True ise aynı gün dahil) ilk işlem gününü geri verir.
+        Returns the first trading day after the day (or on it if inclusive), or None.
+        """
+        i = np.searchsorted(self.__days, self._to_day(day), side="left" if inclusive else "right")
+        return pd.Timestamp(self.__days[i]) if i < len(self.__days) else None
+
+    def previous_trading_day(self, day, inclusive=False):
+        """
+        Verilen günden önceki (inclusive=True ise aynı gün dahil) son işlem gününü geri verir.
+        Returns the last trading day before the day (or on it if inclusive), or None.
+        """
+        i = np.searchsorted(self.__days, self._to_day(day), side="right" if inclusive else "left") - 1
+        return pd.Timestamp(self.__days[i]) if i >= 0 else None
+
+    def trading_days(self, start, end) -> pd.DatetimeIndex:
+        """
+        Verilen aralıktaki işlem günlerini geri verir.
+        Returns the trading days in [start, end].
+        """
+        i = np.searchsorted(self.__days, self._to_day(start), side="left")
+        j = np.searchsorted(self.__days, self._to_day(end), side="right")
+        return pd.DatetimeIndex(self.__days[i:j])
+
+    def first_trading_day_of_month(self, year:int, month:int):
+        """
+        Verilen ayın ilk işlem gününü geri verir.
+        Returns the first trading day of the month, or None if no trading day is known in that month.
+        """
+        first = np.datetime64(f"{year:04d}-{month:02d}", "M")
+        day = self.next_trading_day(first.astype("datetime64[D]"), inclusive=True)
+        if day is None or np.datetime64(day, "M") != first:
+            return None
+        return day
+
+    def first_trading_days_of_months(self, start, end) -> pd.DatetimeIndex:
+        """
+        Verilen aralıktaki her ayın ilk işlem gününü geri verir.
+        Returns the first trading day of every month in [start, end].
+        """
+        days = self.trading_days(start, end).to_numpy().astype("datetime64[D]")
+        if len(days) == 0:
+            return pd.DatetimeIndex(days)
+        months = days.astype("datetime64[M]")
+        is_first = np.concatenate([[True], months[1:] != months[:-1]])
+        return pd.DatetimeIndex(days[is_first])
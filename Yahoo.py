@@ -1,18 +1,50 @@
-import requests, json, datetime
+import os
+import datetime
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from HttpClient import HttpClient
+from JsonBackend import JsonBackend
+from DateRange import split_date_range
 
 class YahooFinancePriceDataFetcher:
     """
     A class for fetching price data from Yahoo Finance API.
 
     Attributes:
-        None
+        DAILY_INTERVALS (set): Intervals whose TARIH column holds only the trading day.
+        CHART_COLUMNS (list): Columns of the price DataFrames.
+        INTRADAY_LIMITS (dict): Intraday interval -> (longest window of a single request, look-back limit) in days.
 
     Methods:
-        fetch_prices(company_code, period_1, period_2, interval="1d", last_x_days=""):
+        fetch_prices(company_code, period_1, period_2, interval="1d", last_x_days="", window_days=None):
             Fetches price history of a requested company within a specified time range.
+        get_intraday_prices(company_code, period_1, period_2, interval="5m", output_dir=None):
+            Fetches intraday prices over a long range in concurrent windows, optionally writing parquet parts incrementally.
+        get_prices_batch(symbols, period_1, period_2, interval="1d", workers=8, align=False, join="outer", window_days=None):
+            Fetches price histories of many symbols concurrently, as a dict or a date-aligned panel.
+        decode_chart(data, interval="1d"):
+            Converts a decoded chart response to a price DataFrame.
     """
 
+    # Gunluk ve daha uzun araliklarda TARIH yalnizca gunu gosterir.
+    DAILY_INTERVALS = {"1d", "5d", "1wk", "1mo", "3mo"}
+
+    # decode_chart() ciktisinin sutunlari
+    CHART_COLUMNS = ["TARIH", "ACILIS", "LOW", "HIGH", "KAPANIS-yahoo", "ADJ.KAPANIS-yahoo", "TEMETTU (TL)", "BOLUNME ORANI"]
+
+    # Gun ici araliklar icin (tek istekte istenebilecek en uzun pencere, geriye gidilebilecek gun sayisi)
+    INTRADAY_LIMITS = {
+        "1m": (7, 30),
+        "2m": (60, 60),
+        "5m": (60, 60),
+        "15m": (60, 60),
+        "30m": (60, 60),
+        "90m": (60, 60),
+        "60m": (730, 730),
+        "1h": (730, 730),
+    }
+
     def __init__(self) -> None:
         pass
 
@@ -32,7 +64,7 @@ class YahooFinancePriceDataFetcher:
         except:
             return None
     
-    def get_prices_from_yahoo(self, company_code, period_1, period_2, interval="1d", last_x_days=""):
+    def get_prices_from_yahoo(self, company_code, period_1, period_2, interval="1d", last_x_days="", window_days=None):
         """
         Get the price history of a requested company within a specified time range.
 
@@ -43,6 +75,8 @@ class YahooFinancePriceDataFetcher:
                 - Valid options include: '1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'.
             - period_1 (str): The start date of the specific time range in 'dd-mm-YYYY' format.
             - period_2 (str): The end date of the specific time range in 'dd-mm-YYYY' format.
+            - window_days (int): If given, the time range is split into windows of this many days that are fetched
+              concurrently and stitched together. Default is None (a single request).
 
         Note:
             - If 'last_x_days' is provided, the time range will be set accordingly.
@@ -59,55 +93,227 @@ class YahooFinancePriceDataFetcher:
             # last x days; a valid link https://query1.finance.yahoo.com/v8/finance/chart/EREGL/IS?&interval=1d&range=7d
             URL = f"https://query1.finance.yahoo.com/v8/finance/chart/{company_code}?&interval={interval}&range={last_x_days}d" # temettu, hisse bolunmesi ve sermaye artirimi bilgilerini icermez
             print(URL)
-        else:
-            period1 = self.__str_to_unix_time(period_1)
-            period2 = self.__str_to_unix_time(period_2)
-            URL = f"https://query1.finance.yahoo.com/v8/finance/chart/{company_code}?&interval={interval}&period1={period1}&period2={period2}&events=capitalGainldivlsplit&" # time range; a valid link https://query1.finance.yahoo.com/v8/finance/chart/EREGL.IS?&interval=1d&period1=1356991200&period2=1357768800
-            # URL = f"https://query1.finance.yahoo.com/v8/finance/chart/{company_code}?&interval={interval}&period1={period1}&period2={period2}"
-    
+            return self.__fetch_chart(URL, interval=interval)
+
+        windows = split_date_range(period_1, period_2, window_days) if window_days is not None else []
+        if len(windows) <= 1:
+            return self.__fetch_chart(self.__chart_url(company_code, interval, self.__str_to_unix_time(period_1), self.__str_to_unix_time(period_2)), interval=interval)
+
+        # Her pencere bir sonrakinin baslangicina kadar istenir; son pencere orijinal period_2'de biter.
+        urls = []
+        for i, (window_start, window_end) in enumerate(windows):
+            period1 = self.__str_to_unix_time(window_start.strftime("%d-%m-%Y"))
+            period2 = self.__str_to_unix_time(period_2) if i == len(windows) - 1 else self.__str_to_unix_time((window_end + datetime.timedelta(days=1)).strftime("%d-%m-%Y"))
+            urls.append(self.__chart_url(company_code, interval, period1, period2))
+        with ThreadPoolExecutor(max_workers=min(len(urls), 8)) as executor:
+            futures = [executor.submit(self.__fetch_chart, url, interval) for url in urls]
+        frames = []
+        for future, url in zip(futures, urls):
+            try:
+                frames.append(future.result())
+            except Exception:
+                # Basarisiz pencere tek basina bir kez daha istenir.
+                frames.append(self.__fetch_chart(url, interval))
+        # Pencere sinirlarinda tekrar eden gunler atilir.
+        return pd.concat(frames, ignore_index=True).drop_duplicates(subset="TARIH").sort_values(by="TARIH", kind="stable").reset_index(drop=True)
+
+    def get_intraday_prices(self, company_code, period_1, period_2, interval="5m", output_dir=None):
+        """
+        Get intraday prices of a requested company over a range longer than Yahoo allows in a single request.
+
+        Parameters:
+            - company_code (str): The code of the requested company.
+            - period_1 (str): The start date of the specific time range in 'dd-mm-YYYY' format.
+            - period_2 (str): The end date of the specific time range in 'dd-mm-YYYY' format.
+            - interval (str): One of the INTRADAY_LIMITS keys. Default is "5m".
+            - output_dir (str): If given, every window that lies completely in the past is written to its own parquet
+              file in this directory as soon as it arrives and is read from disk instead of being fetched again. The
+              window reaching today is still incomplete, so it is never written. Requires pyarrow. Default is None.
+
+        Note:
+            - The range is split into the longest window Yahoo allows for the interval; windows are fetched concurrently,
+              merged and de-duplicated by timestamp.
+            - Yahoo serves intraday bars only for a limited look-back; the start of the range is moved forward to that limit.
+
+        Returns:
+            pandas DataFrame: DataFrame containing the intraday price history, TARIH being the bar's local time.
+        """
+        if interval not in self.INTRADAY_LIMITS:
+            raise ValueError(f"Hatali interval degeri: {interval}. Gecerli secenekler: {list(self.INTRADAY_LIMITS)}")
+        if output_dir is not None:
+            try:
+                import pyarrow # noqa: F401
+            except ImportError:
+                raise ImportError("Parquet dosyasi yazmak icin pyarrow kurulu olmalidir: pip install pyarrow")
+            os.makedirs(output_dir, exist_ok=True)
+
+        window_days, lookback_days = self.INTRADAY_LIMITS[interval]
+        today = datetime.date.today()
+        start = datetime.datetime.strptime(period_1, "%d-%m-%Y").date()
+        end = datetime.datetime.strptime(period_2, "%d-%m-%Y").date()
+        earliest = today - datetime.timedelta(days=lookback_days - 1)
+        if start < earliest:
+            print(f"{interval} verisi en fazla {lookback_days} gun geriye gider; baslangic {earliest.strftime('%d-%m-%Y')} olarak alindi.")
+            start = earliest
+
+        frames, pending = [], []
+        for window_start, window_end in split_date_range(start, end, window_days):
+            # Yalnizca tamamen gecmiste kalan pencereler diske yazilir; bugune uzanan pencere henuz eksiktir ve her seferinde istenir.
+            part = os.path.join(output_dir, f"{company_code}_{interval}_{window_start:%Y%m%d}_{window_end:%Y%m%d}.parquet") if output_dir is not None and window_end < today else None
+            if part is not None and os.path.exists(part):
+                frames.append(pd.read_parquet(part))
+                continue
+            period1 = int(datetime.datetime.combine(window_start, datetime.time()).timestamp())
+            period2 = int(datetime.datetime.combine(window_end + datetime.timedelta(days=1), datetime.time()).timestamp())
+            pending.append((self.__chart_url(company_code, interval, period1, period2), part))
+
+        with ThreadPoolExecutor(max_workers=max(1, min(len(pending), 8))) as executor:
+            futures = {executor.submit(self.__fetch_chart, url, interval): (url, part) for url, part in pending}
+            for future in as_completed(futures):
+                url, part = futures[future]
+                try:
+                    df = future.result()
+                except Exception:
+                    # Basarisiz pencere tek basina bir kez daha istenir.
+                    df = self.__fetch_chart(url, interval)
+                if part is not None:
+                    # Gecici dosyaya yazilip tasinir; yarim kalan dosya tamamlanmis sayilmaz.
+                    df.to_parquet(f"{part}.tmp", index=False)
+                    os.replace(f"{part}.tmp", part)
+                frames.append(df)
+
+        if not frames:
+            return pd.DataFrame(columns=self.CHART_COLUMNS).astype({"TARIH": "datetime64[ns]"})
+        # Pencere sinirlarinda tekrar eden cubuklar zaman damgasina gore atilir; diskten okunan parcalarla ayni zaman birimine cevrilir.
+        df = pd.concat([frame.astype({"TARIH": "datetime64[ns]"}) for frame in frames], ignore_index=True)
+        return df.drop_duplicates(subset="TARIH").sort_values(by="TARIH", kind="stable").reset_index(drop=True)
+
+    def get_prices_batch(self, symbols, period_1, period_2, interval="1d", workers=8, align=False, join="outer", window_days=None):
+        """
+        Get the price history of many symbols concurrently over the shared pooled session.
+
+        Parameters:
+            - symbols (list): Yahoo codes such as 'SISE.IS', 'USDTRY=X' or 'AAPL'.
+            - period_1 (str): The start date of the specific time range in 'dd-mm-YYYY' format.
+            - period_2 (str): The end date of the specific time range in 'dd-mm-YYYY' format.
+            - interval (str): The interval between data points. Default is "1d" (1 day).
+            - workers (int): Number of concurrent requests. Default is 8.
+            - align (bool): If True, a single DataFrame indexed by TARIH with (symbol, column) columns is returned
+              instead of a dict. Default is False.
+            - join (str): How the symbols are aligned on TARIH when align is True; "outer" keeps every date,
+              "inner" keeps the common dates. Default is "outer".
+            - window_days (int): Passed to get_prices_from_yahoo(). Default is None.
+
+        Note:
+            - Symbols that could not be fetched are reported and left out of the result.
+
+        Returns:
+            dict | pandas DataFrame: Symbol -> price history DataFrame in the order of symbols, or the aligned panel.
+        """
+        if join not in ["inner", "outer"]:
+            raise ValueError(f"Hatali join degeri: {join}. Gecerli secenekler: 'inner', 'outer'")
+
+        fetch = lambda symbol: self.get_prices_from_yahoo(company_code=symbol, period_1=period_1, period_2=period_2, interval=interval, window_days=window_days)
+        frames, failed = {}, []
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(symbols)))) as executor:
+            futures = [executor.submit(fetch, symbol) for symbol in symbols]
+        for symbol, future in zip(symbols, futures):
+            try:
+                frames[symbol] = future.result()
+            except Exception as e:
+                print(f"{symbol} icin fiyat verisi alinamadi. Hata: {e}")
+                failed.append(symbol)
+        if failed:
+            print(f"Fiyat verisi alinamayan semboller: {failed}")
+
+        if not align:
+            return frames
+        if not frames:
+            return pd.DataFrame()
+        # Tum semboller tarih indeksi uzerinde tek bir concat ile hizalanir.
+        return pd.concat({symbol: df.set_index("TARIH") for symbol, df in frames.items()}, axis=1, join=join).sort_index()
+
+    @staticmethod
+    def __chart_url(company_code, interval, period1, period2) -> str:
+        """
+        Builds the chart URL of a time range given as Unix timestamps.
+        """
+        return f"https://query1.finance.yahoo.com/v8/finance/chart/{company_code}?&interval={interval}&period1={period1}&period2={period2}&events=capitalGainldivlsplit&" # time range; a valid link https://query1.finance.yahoo.com/v8/finance/chart/EREGL.IS?&interval=1d&period1=1356991200&period2=1357768800
+
+    def __fetch_chart(self, URL, interval="1d") -> pd.DataFrame:
+        """
+        Fetches one chart response and converts it to a price DataFrame.
+
+        Parameters:
+            - URL (str): The chart URL.
+            - interval (str): The interval of the request. Default is "1d" (1 day).
+
+        Returns:
+            pandas DataFrame: DataFrame containing the price history data of the response.
+        """
         headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"}
-        response = requests.get(url=URL, headers=headers)
-        data = json.loads(response.content)
-        # 1. Extracting price values
-        price_data = data["chart"]["result"][0]
-        # Converting UNIX timestamps to regular time
-        timestamps_unix = price_data["timestamp"]
-        # Extracting timestamp
-        timestamps_regular = [datetime.datetime.fromtimestamp(ts).date() for ts in timestamps_unix]
-        # Extracting indicators
-        indicators = price_data["indicators"]["quote"][0]
-        # Extracting open, close, high, low, adjclose values
-        open_values = indicators["open"]
-        close_values = indicators["close"]
-        high_values = indicators["high"]
-        low_values = indicators["low"]
-        adjclose_values = price_data["indicators"]["adjclose"][0]["adjclose"]
-
-        data_dict = {
-            "TARIH": timestamps_regular,
-            "ACILIS": open_values,
-            "LOW": low_values,
-            "HIGH": high_values,
-            "KAPANIS-yahoo": close_values,
-            "ADJ.KAPANIS-yahoo": adjclose_values
-        }
-        df = pd.DataFrame(data_dict)
-        df["TARIH"] = pd.to_datetime(df["TARIH"])    
-        
-        try:
-            # 2. Extracting dividend, splits and capital gain values
-            div_data = data["chart"]["result"][0]["events"]["dividends"]
-            # Extracting timestamp
-            timestamps_regular = [datetime.datetime.fromtimestamp(int(ts)).date() for ts in div_data.keys()]
-            # Extracting the data; datetime_of_div: dividend_amount
-            d = {
-                datetime.datetime.fromtimestamp(int(timestamp)).date() : div["amount"] for timestamp, div in div_data.items()
-            }
-            # Mapping dividend values to TEMETTU column using TARIH column
-            df["TEMETTU (TL)"] = df["TARIH"].map(d)
-            # Filling NaN values with zeros
-            df["TEMETTU (TL)"] = df["TEMETTU (TL)"].fillna(0)
-            return df
-        except:
-            df["TEMETTU (TL)"] = 0.
-            return df
\ No newline at end of file
+        response = HttpClient.shared().request("GET", URL, headers=headers)
+        return self.decode_chart(JsonBackend.shared().loads(response.content), interval=interval)
+
+    @classmethod
+    def decode_chart(cls, data, interval="1d") -> pd.DataFrame:
+        """
+        Converts a decoded chart response to a price DataFrame in a single vectorized pass.
+
+        Parameters:
+            - data (dict): The decoded chart response.
+            - interval (str): The interval of the request. Default is "1d" (1 day).
+
+        Note:
+            - Timestamps are converted in the exchange's timezone. For daily and longer intervals TARIH is the trading day,
+              for intraday intervals it is the bar's local time.
+            - Dividends and splits are aligned on the trading day. Missing event blocks give 0 dividends and a split ratio of 1.
+
+        Returns:
+            pandas DataFrame: DataFrame containing the price history data.
+        """
+        result = data["chart"]["result"]
+        if not result:
+            raise ValueError(f"Yahoo yaniti bos: {data['chart'].get('error')}")
+        price_data = result[0]
+        meta = price_data.get("meta") or {}
+        # Aralikta islem yoksa timestamp blogu gelmez.
+        if not price_data.get("timestamp"):
+            return pd.DataFrame(columns=cls.CHART_COLUMNS).astype({"TARIH": "datetime64[ns]"})
+
+        timezone = meta.get("exchangeTimezoneName") or datetime.timezone(datetime.timedelta(seconds=meta.get("gmtoffset", 0)))
+        to_local = lambda seconds: pd.to_datetime(np.asarray(seconds, dtype=np.int64), unit="s", utc=True).tz_convert(timezone).tz_localize(None)
+        # 1. Price values; the whole timestamp array is converted at once.
+        timestamps = to_local(price_data["timestamp"])
+        days = timestamps.normalize()
+        indicators = price_data["indicators"]
+        quote = indicators["quote"][0]
+        adjclose = (indicators.get("adjclose") or [{}])[0].get("adjclose", quote["close"])
+        df = pd.DataFrame({
+            "TARIH": days if interval in cls.DAILY_INTERVALS else timestamps,
+            "ACILIS": np.asarray(quote["open"], dtype=float),
+            "LOW": np.asarray(quote["low"], dtype=float),
+            "HIGH": np.asarray(quote["high"], dtype=float),
+            "KAPANIS-yahoo": np.asarray(quote["close"], dtype=float),
+            "ADJ.KAPANIS-yahoo": np.asarray(adjclose, dtype=float),
+        })
+
+        # 2. Dividends and splits, aligned on the trading day of the first bar of that day.
+        events = price_data.get("events") or {}
+        first_bar = ~days.duplicated()
+        dividends = cls.__event_series(events.get("dividends"), lambda event: event["amount"], to_local, "sum")
+        splits = cls.__event_series(events.get("splits"), lambda event: event["numerator"] / event["denominator"], to_local, "prod")
+        df["TEMETTU (TL)"] = np.where(first_bar, dividends.reindex(days, fill_value=0.).to_numpy(), 0.)
+        df["BOLUNME ORANI"] = np.where(first_bar, splits.reindex(days, fill_value=1.).to_numpy(), 1.)
+        return df
+
+    @staticmethod
+    def __event_series(block, value, to_local, combine) -> pd.Series:
+        """
+        Builds a trading day indexed series from a dividends/splits event block; a missing block gives an empty series.
+        """
+        if not block:
+            return pd.Series(dtype=float)
+        events = list(block.values())
+        days = to_local([event["date"] for event in events]).normalize()
+        return pd.Series([value(event) for event in events], index=days, dtype=float).groupby(level=0).agg(combine)
@@ -0,0 +1,43 @@
+"""
+Karşılaştırma betiklerinin ortak yardımcıları.
+Helpers shared by the benchmark scripts.
+
+İçe aktarıldığında repo kök dizini sys.path'e eklenir; böylece betikler `python benchmarks/<betik>.py` ile çalıştırılabilir.
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Kayitli sayfa ve yanitlarin tutuldugu dizin
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
+
+def measure(function, repeat:int) -> float:
+    """
+    Fonksiyonun en iyi çalışma süresini saniye cinsinden geri verir.
+    Returns the best run time of the function in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def parse_arguments(description:str, repeat_help:str, save_metavar=None, save_help=None) -> argparse.Namespace:
+    """
+    Ortak --repeat ve (save_metavar verilirse) --save seçeneklerini ayrıştırır.
+    Parses the shared --repeat option and, if save_metavar is given, the --save option.
+
+    Returns:
+        argparse.Namespace: Parsed arguments; save is None when the option is not offered or not used.
+    """
+    argument_parser = argparse.ArgumentParser(description=description)
+    if save_metavar is not None:
+        argument_parser.add_argument("--save", nargs="+", metavar=save_metavar, help=save_help)
+    else:
+        argument_parser.set_defaults(save=None)
+    argument_parser.add_argument("--repeat", type=int, default=10, help=repeat_help)
+    return argument_parser.parse_args()
@@ -0,0 +1,65 @@
+"""
+get_dividend_data() için HTML ayrıştırma karşılaştırması.
+Benchmark of the HTML parsing step of get_dividend_data().
+
+Kayıtlı şirket kartı sayfaları üzerinde eski yol (tüm sayfa + html.parser) ile hedefli yol (yalnızca temettü tablosu +
+lxml, kuruluysa) karşılaştırılır ve iki yolun aynı tabloyu ürettiği kontrol edilir.
+
+Usage:
+    python benchmarks/dividend_parsing.py --save THYAO EREGL ASELS   # sayfalari indirip kaydeder
+    python benchmarks/dividend_parsing.py --repeat 20                # kayitli sayfalar uzerinde olcum yapar
+"""
+import os
+
+from _common import PAGES_DIR, measure, parse_arguments
+from IsYatirim import IsYatirimScraper, HTML_PARSER
+
+def save_pages(tickers:list) -> None:
+    """
+    Şirket kartı sayfalarını indirip PAGES_DIR altına kaydeder.
+    Downloads the company card pages and stores them under PAGES_DIR.
+    """
+    os.makedirs(PAGES_DIR, exist_ok=True)
+    scraper = IsYatirimScraper()
+    for ticker in tickers:
+        html = scraper.make_request(method="GET", url=scraper.API_URL_TEMETTU_GECMISI + ticker)
+        if html is None:
+            print(f"{ticker}: sayfa indirilemedi")
+            continue
+        with open(os.path.join(PAGES_DIR, f"{ticker}.html"), "wb") as f:
+            f.write(html)
+        print(f"{ticker}: {len(html) / 1024:.0f} KB kaydedildi")
+
+def run(repeat:int) -> None:
+    pages = sorted(name for name in os.listdir(PAGES_DIR) if name.endswith(".html")) if os.path.isdir(PAGES_DIR) else []
+    if not pages:
+        print(f"{PAGES_DIR} altinda kayitli sayfa yok; once --save ile sayfa indirin.")
+        return
+
+    print(f"Hedefli yol ayristiricisi: {HTML_PARSER}")
+    print(f"{'sayfa':<16}{'tum sayfa (ms)':>16}{'hedefli (ms)':>16}{'hiz':>8}")
+    total_full = total_targeted = 0.0
+    for name in pages:
+        with open(os.path.join(PAGES_DIR, name), "rb") as f:
+            html = f.read()
+        full = lambda: IsYatirimScraper.parse_dividend_page(html, parser="html.parser", targeted=False)
+        targeted = lambda: IsYatirimScraper.parse_dividend_page(html)
+        if not full().equals(targeted()):
+            print(f"{name}: iki yolun sonuclari farkli!")
+        full_time, targeted_time = measure(full, repeat), measure(targeted, repeat)
+        total_full += full_time
+        total_targeted += targeted_time
+        print(f"{name:<16}{full_time * 1000:>16.1f}{targeted_time * 1000:>16.1f}{full_time / targeted_time:>7.1f}x")
+    print(f"{'toplam':<16}{total_full * 1000:>16.1f}{total_targeted * 1000:>16.1f}{total_full / total_targeted:>7.1f}x")
+
+if __name__ == "__main__":
+    args = parse_arguments(
+        description="get_dividend_data HTML parsing benchmark",
+        repeat_help="number of runs per page (best one is reported)",
+        save_metavar="TICKER",
+        save_help="download and store the company card pages of these tickers",
+    )
+    if args.save:
+        save_pages(args.save)
+    else:
+        run(args.repeat)
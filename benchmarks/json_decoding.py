@@ -0,0 +1,81 @@
+"""
+JsonBackend çözücülerinin karşılaştırması.
+Benchmark of the JsonBackend decoders.
+
+KAP'ın tüm şirketler için döndürdüğü bildirim listesine ve "d" zarfı içinde metin olarak gönderilen HisseTekil fiyat
+yanıtına benzeyen sentetik belgeler, kurulu her çözücü ile çözülür. benchmarks/pages altında kayıtlı .json dosyaları
+varsa onlar da ölçüme dahil edilir.
+
+Usage:
+    python benchmarks/json_decoding.py --repeat 20
+"""
+import os
+import json
+import random
+
+from _common import PAGES_DIR, measure, parse_arguments
+from JsonBackend import JsonBackend
+
+def disclosure_document(count:int) -> bytes:
+    """
+    KAP bildirim listesine benzeyen bir belge üretir.
+    Builds a document shaped like the KAP disclosure list.
+    """
+    disclosures = [
+        {
+            "disclosureIndex": 1200000 + i,
+            "companyName": f"ÖRNEK ŞİRKET {i % 600} A.Ş.",
+            "stockCodes": f"HS{i % 600:03d}",
+            "title": "Özel Durum Açıklaması (Genel)",
+            "publishDate": "02.11.23 18:05",
+            "disclosureType": random.choice(["FR", "ODA", "DG"]),
+            "summary": "Şirketimiz yönetim kurulu toplantısında alınan kararlar hakkında bilgi verilmektedir." * 2,
+        }
+        for i in range(count)
+    ]
+    return json.dumps(disclosures, ensure_ascii=False).encode("utf-8")
+
+def price_document(days:int) -> bytes:
+    """
+    "d" zarfı içinde metin olarak gönderilen HisseTekil yanıtına benzeyen bir belge üretir.
+    Builds a document shaped like a HisseTekil response whose payload is a JSON string inside "d".
+    Alan isimleri __process_is_yatirim_price_data() tarafından okunan gerçek alanlardır.
+    """
+    rows = [
+        {
+            "HGDG_HS_KODU": "THYAO",
+            "HGDG_TARIH": f"{1 + i % 28:02d}-{1 + i % 12:02d}-{2000 + i // 260}",
+            "HGDG_MIN": round(random.uniform(1, 300), 2),
+            "HGDG_MAX": round(random.uniform(1, 300), 2),
+            "HGDG_KAPANIS": round(random.uniform(1, 300), 2),
+            "HGDG_HACIM": round(random.uniform(1e6, 1e9), 2),
+            "DOLAR_BAZLI_FIYAT": round(random.uniform(1, 30), 4),
+            "ENDEKS_BAZLI_FIYAT": round(random.uniform(1, 30), 4),
+            "DD_DEGER": round(random.uniform(1, 30), 4),
+            "END_DEGER": round(random.uniform(1000, 10000), 2),
+        }
+        for i in range(days)
+    ]
+    return json.dumps({"d": json.dumps(rows)}).encode("utf-8")
+
+def run(repeat:int) -> None:
+    random.seed(0)
+    documents = {
+        "bildirimler (20k)": disclosure_document(20000),
+        "HisseTekil (10 yil)": price_document(2600),
+    }
+    if os.path.isdir(PAGES_DIR):
+        for name in sorted(os.listdir(PAGES_DIR)):
+            if name.endswith(".json"):
+                with open(os.path.join(PAGES_DIR, name), "rb") as f:
+                    documents[name] = f.read()
+
+    backends = [JsonBackend(name) for name in JsonBackend.available()]
+    print(f"{'belge':<24}{'boyut (KB)':>12}" + "".join(f"{backend.name + ' (ms)':>14}" for backend in backends))
+    for name, content in documents.items():
+        timings = [measure(lambda: backend.decode(content), repeat) for backend in backends]
+        print(f"{name:<24}{len(content) / 1024:>12.0f}" + "".join(f"{timing * 1000:>14.1f}" for timing in timings))
+
+if __name__ == "__main__":
+    args = parse_arguments(description="JsonBackend decoding benchmark", repeat_help="number of runs per document (best one is reported)")
+    run(args.repeat)
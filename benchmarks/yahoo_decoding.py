@@ -0,0 +1,109 @@
+"""
+Yahoo chart yanıtı çözümleme karşılaştırması.
+Benchmark of the Yahoo chart response decoding.
+
+Kayıtlı 20 yıllık günlük bir chart yanıtı üzerinde eski satır satır çözümleme ile vektörize
+YahooFinancePriceDataFetcher.decode_chart() karşılaştırılır. Kayıtlı yanıt yoksa aynı biçimde sentetik bir yanıt üretilir.
+
+Usage:
+    python benchmarks/yahoo_decoding.py --save THYAO.IS       # 20 yillik gunluk yaniti kaydeder
+    python benchmarks/yahoo_decoding.py --repeat 20           # kayitli (ya da sentetik) yanitlar uzerinde olcum yapar
+"""
+import os
+import time
+import random
+import datetime
+
+import pandas as pd
+from _common import PAGES_DIR, measure, parse_arguments
+from HttpClient import HttpClient
+from JsonBackend import JsonBackend
+from Yahoo import YahooFinancePriceDataFetcher
+
+def save_response(symbol:str) -> None:
+    """
+    Sembolün son 20 yıllık günlük chart yanıtını PAGES_DIR altına kaydeder.
+    Stores the 20-year daily chart response of the symbol under PAGES_DIR.
+    """
+    os.makedirs(PAGES_DIR, exist_ok=True)
+    period2 = int(time.time())
+    period1 = period2 - 20 * 365 * 24 * 60 * 60
+    url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?&interval=1d&period1={period1}&period2={period2}&events=capitalGainldivlsplit&"
+    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"}
+    response = HttpClient.shared().request("GET", url, headers=headers, ttl=0)
+    with open(os.path.join(PAGES_DIR, f"yahoo_{symbol}.json"), "wb") as f:
+        f.write(response.content)
+    print(f"{symbol}: {len(response.content) / 1024:.0f} KB kaydedildi")
+
+def synthetic_response(years=20) -> dict:
+    """
+    20 yıllık günlük bir chart yanıtı üretir.
+    Builds a chart response shaped like a 20-year daily answer.
+    """
+    random.seed(0)
+    days = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=years * 252)
+    timestamps = [int(day.timestamp()) + 7 * 60 * 60 for day in days] # 10:00 Istanbul
+    prices = [round(random.uniform(1, 300), 2) for _ in timestamps]
+    dividends = {str(ts): {"amount": 0.5, "date": ts} for ts in timestamps[100::250]}
+    splits = {str(ts): {"date": ts, "numerator": 2, "denominator": 1, "splitRatio": "2:1"} for ts in timestamps[1500::2000]}
+    return {"chart": {"result": [{
+        "meta": {"exchangeTimezoneName": "Europe/Istanbul", "gmtoffset": 10800},
+        "timestamp": timestamps,
+        "events": {"dividends": dividends, "splits": splits},
+        "indicators": {"quote": [{"open": prices, "close": prices, "high": prices, "low": prices, "volume": prices}], "adjclose": [{"adjclose": prices}]},
+    }], "error": None}}
+
+def legacy_decode(data) -> pd.DataFrame:
+    """
+    Vektörize çözümlemeden önceki satır satır yöntem; yalnızca karşılaştırma için.
+    The row-by-row decoding used before decode_chart(); kept here only for comparison.
+    """
+    price_data = data["chart"]["result"][0]
+    timestamps_regular = [datetime.datetime.fromtimestamp(ts).date() for ts in price_data["timestamp"]]
+    indicators = price_data["indicators"]["quote"][0]
+    df = pd.DataFrame({
+        "TARIH": timestamps_regular,
+        "ACILIS": indicators["open"],
+        "LOW": indicators["low"],
+        "HIGH": indicators["high"],
+        "KAPANIS-yahoo": indicators["close"],
+        "ADJ.KAPANIS-yahoo": price_data["indicators"]["adjclose"][0]["adjclose"],
+    })
+    df["TARIH"] = pd.to_datetime(df["TARIH"])
+    try:
+        div_data = price_data["events"]["dividends"]
+        d = {datetime.datetime.fromtimestamp(int(timestamp)).date(): div["amount"] for timestamp, div in div_data.items()}
+        df["TEMETTU (TL)"] = df["TARIH"].map(d).fillna(0)
+    except:
+        df["TEMETTU (TL)"] = 0.
+    return df
+
+def run(repeat:int) -> None:
+    responses = {}
+    if os.path.isdir(PAGES_DIR):
+        for name in sorted(os.listdir(PAGES_DIR)):
+            if name.startswith("yahoo_") and name.endswith(".json"):
+                with open(os.path.join(PAGES_DIR, name), "rb") as f:
+                    responses[name] = JsonBackend.shared().loads(f.read())
+    if not responses:
+        responses["sentetik (20 yil)"] = synthetic_response()
+
+    print(f"{'yanit':<24}{'satir':>8}{'eski (ms)':>12}{'vektorize (ms)':>16}{'hiz':>8}")
+    for name, data in responses.items():
+        rows = len(data["chart"]["result"][0].get("timestamp") or [])
+        legacy = measure(lambda: legacy_decode(data), repeat)
+        vectorized = measure(lambda: YahooFinancePriceDataFetcher.decode_chart(data), repeat)
+        print(f"{name:<24}{rows:>8}{legacy * 1000:>12.1f}{vectorized * 1000:>16.1f}{legacy / vectorized:>7.1f}x")
+
+if __name__ == "__main__":
+    args = parse_arguments(
+        description="Yahoo chart decoding benchmark",
+        repeat_help="number of runs per response (best one is reported)",
+        save_metavar="SYMBOL",
+        save_help="download and store the 20-year daily chart response of these symbols",
+    )
+    if args.save:
+        for symbol in args.save:
+            save_response(symbol)
+    else:
+        run(args.repeat)
@@ -3,6 +3,7 @@ import streamlit as st
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))) # adding parent dirs to python path
 from IsYatirim import IsYatirimScraper
+from PriceStore import PriceStore
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))) # adding parent dirs to python path
 from use_case_hisse_analiz_python import HisseAnaliz
 from KAPScraper import KAPHelper, KAP
@@ -12,7 +13,7 @@ from datetime import date, timedelta
 @st.cache_data(show_spinner=False)
 def get_price_df(ticker:str, start_date:str, end_date:str):
 
-    price_df = IsYatirimScraper().get_is_yatirim_price_data(ticker=ticker, start_date=start_date, end_date=end_date)
+    price_df = IsYatirimScraper(price_store=PriceStore()).get_is_yatirim_price_data(ticker=ticker, start_date=start_date, end_date=end_date)
     return price_df[["TARIH", "GUN ICI EN DUSUK", "GUN ICI EN YUKSEK", "HISSE KODU", "KAPANIS FIYATI (TL)", "DOLAR KURU (TL)", "DOLAR BAZLI FIYAT (USD)"]]
 
 @st.cache_data(show_spinner=False)
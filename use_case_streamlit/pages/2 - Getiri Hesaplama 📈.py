@@ -10,12 +10,13 @@ pd.set_option('display.colheader_justify', 'center')
 
 
 @st.cache_data(show_spinner=False)
-def get_data(hisse_kodu, tarih_baslangic, tarih_son, hesaplama_tipi, div_reinvest, tutar):
+def get_data(hisse_kodu, tarih_baslangic, tarih_son, hesaplama_tipi, tutar):
+    """
+    Returns the results of both dividend options from a single download and preprocessing pass.
+    """
     try:
         rc = ReturnCalculator(ticker=hisse_kodu, period1=tarih_baslangic, period2=tarih_son)
-        rf = rc.df_maker(hesaplama_tipi=hesaplama_tipi, div_reinvest=div_reinvest, tutar=tutar)
-        rp = rc.report(hesaplama_tipi=hesaplama_tipi, div_reinvest=div_reinvest, tutar=tutar)
-        return rf, rp
+        return rc.evaluate_scenarios([(hesaplama_tipi, True, tutar), (hesaplama_tipi, False, tutar)])
     except RuntimeError as e:
         st.error(e)
         st.stop()
@@ -119,25 +120,17 @@ def calculate(button, ticker, start_date, end_date, hesaplama_tipi, div_re, tuta
 
 
     if button:
-        # Users choice
-        df, rp = get_data(
+        results = get_data(
             hisse_kodu=ticker, 
             tarih_baslangic=start_date.strftime("%d-%m-%Y"), 
             tarih_son=end_date.strftime("%d-%m-%Y"),
             hesaplama_tipi=hesaplama_tipi,
-            div_reinvest=div_re,
             tutar=tutar 
             )
-
+        # Users choice
+        df, rp = results[(hesaplama_tipi, div_re, tutar)]
         # Alternative scenario
-        df_, rp_ = get_data(
-            hisse_kodu=ticker, 
-            tarih_baslangic=start_date.strftime("%d-%m-%Y"), 
-            tarih_son=end_date.strftime("%d-%m-%Y"),
-            hesaplama_tipi=hesaplama_tipi,
-            div_reinvest=not div_re,
-            tutar=tutar 
-            )
+        df_, rp_ = results[(hesaplama_tipi, not div_re, tutar)]
         # Layout setting
         a, b = st.columns(2)
         # Outputting computation parameters
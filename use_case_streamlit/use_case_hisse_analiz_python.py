@@ -3,6 +3,7 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))) # adding parent dir to python path
 from Rasyolar import Review
+from PriceStore import PriceStore
 from KAPScraper import KAPHelper, KAP
 from datetime import datetime, timedelta
 
@@ -52,7 +53,7 @@ class HisseAnaliz():
         """
         self.firma_kodu = firma_kodu
         try:
-            self.rev = Review(company_name=firma_kodu, year=datetime.today().year)
+            self.rev = Review(company_name=firma_kodu, year=datetime.today().year, price_store=PriceStore())
         except Exception as e:
             print(f"Firma temel verileri alinirken hata olustu. Hata: {e}")
         try: